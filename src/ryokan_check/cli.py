@@ -1,7 +1,9 @@
 """CLI interface for Ryokan availability checker."""
 
 import asyncio
-from datetime import date, datetime
+import contextlib
+import signal
+from datetime import datetime
 from pathlib import Path
 from typing import Annotated
 
@@ -10,14 +12,23 @@ from rich.console import Console
 from rich.table import Table
 
 from ryokan_check.config import Config
-from ryokan_check.domain.models import CheckResult
+from ryokan_check.domain.models import CheckResult, RoomAvailability
 from ryokan_check.domain.property import Property, get_property_config
 from ryokan_check.notifier import EmailConfig, EmailNotifier
-from ryokan_check.state import NotificationState, migrate_old_state_file
+from ryokan_check.ports.scraper import AvailabilityScraper
+from ryokan_check.properties import browser
+from ryokan_check.state import NotificationState
 
-# Import property modules to trigger registration
-import ryokan_check.properties.miyakowasure  # noqa: F401
-import ryokan_check.properties.miyamaso  # noqa: F401
+# uvloop is a faster drop-in event loop; it isn't available on Windows
+try:
+    from uvloop import run as run_async
+except ImportError:
+    from asyncio import run as run_async
+
+# Register every property before any config lookup
+from ryokan_check.properties import register_all
+
+register_all()
 
 app = typer.Typer(
     name="ryokan-check",
@@ -26,120 +37,177 @@ app = typer.Typer(
 )
 console = Console()
 
+# Static cell markup for the status tables
+_STATUS_AVAILABLE = "[green]Available[/green]"
+_STATUS_UNAVAILABLE = "[red]Unavailable[/red]"
+_ONSEN_YES = "[green]Yes[/green]"
+_ONSEN_NO = "[dim]No[/dim]"
+
 
 def parse_properties(value: str) -> list[Property]:
     """Parse property argument (can be comma-separated or 'all')."""
-    if value.lower() == "all":
+    if value.strip().lower() == "all":
         return list(Property)
 
-    properties = []
+    # Insertion-ordered dict drops repeats without rescanning a list
+    properties: dict[Property, None] = {}
     for p in value.split(","):
-        prop = Property.from_string(p.strip())
+        prop = Property.from_string(p)
         if prop:
-            if prop not in properties:
-                properties.append(prop)
+            properties[prop] = None
         else:
             console.print(f"[red]Unknown property: {p}[/red]")
             console.print("Valid options: miyakowasure, miyamaso, takamiya, all")
             raise typer.Exit(1)
-    return properties
+    return list(properties)
 
 
 def parse_rooms_for_property(room_str: str, prop: Property) -> list:
     """Parse room filter for a specific property."""
-    from ryokan_check.properties.miyamaso.rooms import MiyamasoRoom
-
     config = get_property_config(prop)
-    rooms = []
+    rooms: dict = {}
 
     for r in room_str.split(","):
-        r_stripped = r.strip()
-        # For Miyamaso, handle 'rian' specially to return both variants
-        if prop == Property.MIYAMASO and r_stripped.lower() in ("rian", "rian-sansui", "sansui"):
-            rooms.extend(MiyamasoRoom.parse_multiple(r_stripped))
-        else:
-            room = config.parse_room(r_stripped)
-            if room:
-                if room not in rooms:
-                    rooms.append(room)
-            else:
-                console.print(f"[red]Unknown room '{r}' for {prop.value}[/red]")
-                valid = [str(rm.room_id) for rm in config.get_rooms()]
-                console.print(f"Valid room IDs: {', '.join(valid)}")
-                raise typer.Exit(1)
-    return rooms
+        # Some properties expand one entry into several rooms (e.g. 'rian')
+        parsed = config.parse_rooms(r.strip())
+        if not parsed:
+            console.print(f"[red]Unknown room '{r}' for {prop.value}[/red]")
+            valid = [str(rm.room_id) for rm in config.get_rooms()]
+            console.print(f"Valid room IDs: {', '.join(valid)}")
+            raise typer.Exit(1)
+        rooms.update(dict.fromkeys(parsed))
+    return list(rooms)
 
 
-def log(message: str) -> None:
-    """Log a timestamped message."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    console.print(f"[dim]{timestamp}[/dim] {message}")
+def log(*messages: str) -> None:
+    """Log timestamped messages, one per line, in a single console write."""
+    prefix = f"[dim]{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}[/dim] "
+    console.print("\n".join(prefix + message for message in messages))
+
+
+def _format_dates(config: Config) -> str:
+    """Format the configured check-in dates for log output."""
+    return ", ".join(str(d) for d in config.check_in_dates)
 
 
 async def run_check_loop(config: Config) -> None:
     """Main check loop for all configured properties."""
-    # Migrate old state file if needed
-    migrate_old_state_file(config.state_dir)
-
     # Load state for each property
     states: dict[Property, NotificationState] = {}
     for prop in config.properties:
         state = NotificationState(state_file=config.state_file_for(prop))
-        state.load()
         states[prop] = state
 
     notifier = EmailNotifier(config.email_config) if config.email_config else None
 
-    log(f"Starting availability checker for {config.check_in_date} ({config.nights} night(s))")
-    log(f"Properties: {', '.join(p.value for p in config.properties)}")
-    log(f"Guests: {config.guests}")
-    log(f"Check interval: {config.check_interval_minutes} minutes")
+    startup = [
+        f"Starting availability checker for {_format_dates(config)} ({config.nights} night(s))",
+        f"Properties: {', '.join(p.value for p in config.properties)}",
+        f"Guests: {config.guests}",
+        f"Check interval: {config.check_interval_minutes} minutes",
+    ]
     if notifier:
-        log(f"Notifications via email to: {config.email_config.to_address}")
+        startup.append(f"Notifications via email to: {config.email_config.to_address}")
     else:
-        log("[yellow]No notification method configured - will only log to console[/yellow]")
+        startup.append("[yellow]No notification method configured - will only log to console[/yellow]")
+    startup.extend(
+        f"[yellow]Warning: {warning}[/yellow]" for warning in config.validate_guests_for_rooms()
+    )
+    log(*startup)
+
+    # SIGUSR1 wakes the loop for an immediate re-check; SIGINT/SIGTERM stop it
+    # after the current check, closing browsers and SMTP on the way out
+    wake = asyncio.Event()
+    shutdown = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    def request_shutdown() -> None:
+        shutdown.set()
+        # Restore the default handlers, so a second Ctrl-C force-quits a hung check
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.remove_signal_handler(sig)
+
+    with contextlib.suppress(AttributeError, NotImplementedError):
+        loop.add_signal_handler(signal.SIGINT, request_shutdown)
+        loop.add_signal_handler(signal.SIGTERM, request_shutdown)
+        loop.add_signal_handler(signal.SIGUSR1, wake.set)
+
+    async with contextlib.AsyncExitStack() as stack:
+        # Keep one SMTP connection and one browser context per property open
+        # for the lifetime of the loop instead of reopening them on every check
+        if notifier:
+            await stack.enter_async_context(notifier)
+        # Registered before any scraper, so the shared browser closes only
+        # after every scraper's context has
+        stack.push_async_callback(browser.shutdown)
+        scrapers: dict[Property, AvailabilityScraper] = {}
+        for prop in config.properties:
+            scraper_class = get_property_config(prop).scraper_class
+            scrapers[prop] = await stack.enter_async_context(scraper_class(config))
 
-    warnings = config.validate_guests_for_rooms()
-    for warning in warnings:
-        log(f"[yellow]Warning: {warning}[/yellow]")
+        # Caps how many properties are being scraped at the same moment
+        scrape_limit = asyncio.BoundedSemaphore(config.max_concurrent_scrapers)
 
-    check_count = 0
-    while True:
-        check_count += 1
-        log(f"[bold]Check #{check_count}[/bold]")
+        check_count = 0
+        while not shutdown.is_set():
+            check_count += 1
+            log(f"[bold]Check #{check_count}[/bold]")
 
-        for prop in config.properties:
-            await _check_single_property(config, prop, states[prop], notifier)
+            # Properties are independent, so scrape them all at once. A crash
+            # cancels the sibling checks and is logged; the loop carries on.
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    for prop in config.properties:
+                        tg.create_task(
+                            _check_single_property(
+                                prop, scrapers[prop], states[prop], notifier, scrape_limit
+                            )
+                        )
+            except* Exception as eg:
+                for error in eg.exceptions:
+                    log(f"[red]Check failed: {error!r}[/red]")
+
+            if shutdown.is_set():
+                break
+            log(f"Next check in {config.check_interval_minutes} minutes...")
+            waiters = {asyncio.create_task(wake.wait()), asyncio.create_task(shutdown.wait())}
+            _, pending = await asyncio.wait(
+                waiters,
+                timeout=config.check_interval_minutes * 60,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for waiter in pending:
+                waiter.cancel()
+            if wake.is_set() and not shutdown.is_set():
+                wake.clear()
+                log("Re-check requested")
 
-        log(f"Next check in {config.check_interval_minutes} minutes...")
-        await asyncio.sleep(config.check_interval_minutes * 60)
+    log("Shutting down...")
 
 
 async def _check_single_property(
-    config: Config,
     prop: Property,
+    scraper: AvailabilityScraper,
     state: NotificationState,
     notifier: EmailNotifier | None,
+    scrape_limit: asyncio.BoundedSemaphore,
 ) -> CheckResult:
-    """Check availability for a single property."""
+    """Check availability for a single property and notify new openings."""
     prop_config = get_property_config(prop)
-    scraper_class = prop_config.scraper_class
-
-    log(f"[bold cyan]{prop_config.display_name}[/bold cyan]")
 
-    async with scraper_class(config) as scraper:
-        result = await scraper.check_availability()
+    async with scrape_limit:
+        result = await _run_check(prop, scraper)
 
     if result.error:
-        log(f"  [red]Error: {result.error}[/red]")
         return result
 
     available = result.available_rooms
     if available:
         log(f"  [green]Found {len(available)} available room(s)![/green]")
+        to_send: list[RoomAvailability] = []
         for room in available:
             onsen_badge = " [bold magenta](Private Onsen!)[/bold magenta]" if room.room.has_private_onsen else ""
-            log(f"  - {room.room.display_name}{onsen_badge}")
+            log(f"  - {room.room.display_name} ({room.check_in}){onsen_badge}")
             if room.price_per_person:
                 log(f"    Price: {room.price_per_person:,}/person")
             if room.spots_left:
@@ -149,61 +217,104 @@ async def _check_single_property(
             if not room.price_per_person:
                 log("    [dim]Price TBD - skipping notification[/dim]")
             elif notifier and state.should_notify(room):
-                success = await notifier.send(room, prop_config)
-                if success:
-                    state.mark_notified(room)
-                    log("    [green]Notification sent![/green]")
-                else:
-                    log("    [red]Failed to send notification[/red]")
+                to_send.append(room)
             elif notifier:
                 log("    [dim]Already notified within 24h[/dim]")
+
+        # Send all notifications for this check concurrently
+        if notifier and to_send:
+            sent = await asyncio.gather(
+                *(notifier.send(room, prop_config) for room in to_send),
+                return_exceptions=True,
+            )
+            # One write for the whole batch
+            async with state.batch():
+                for room, success in zip(to_send, sent):
+                    if success is True:
+                        state.mark_notified(room)
+                        log(f"  [green]Notification sent for {room.room.display_name}![/green]")
+                    else:
+                        log(f"  [red]Failed to send notification for {room.room.display_name}[/red]")
     else:
         log("  [dim]No rooms available[/dim]")
 
-    # Display table
-    if result.rooms_checked:
-        table = Table(title=f"{prop_config.display_name} Status", show_header=True)
-        table.add_column("Room")
-        table.add_column("Status")
-        table.add_column("Price")
-        table.add_column("Private Onsen")
-        for room in result.rooms_checked:
-            status = "[green]Available[/green]" if room.available else "[red]Unavailable[/red]"
-            price = f"{room.price_per_person:,}" if room.price_per_person else "-"
-            onsen = "[green]Yes[/green]" if room.room.has_private_onsen else "[dim]No[/dim]"
-            table.add_row(room.room.display_name, status, price, onsen)
-        console.print(table)
+    return result
+
+
+async def _run_check(prop: Property, scraper: AvailabilityScraper) -> CheckResult:
+    """Scrape one property, then log its header and error or status table."""
+    prop_config = get_property_config(prop)
+
+    result = await scraper.check_availability()
+
+    # Logged after scraping so concurrent checks don't interleave
+    log(f"[bold cyan]{prop_config.display_name}[/bold cyan]")
+    if result.error:
+        log(f"  [red]Error: {result.error}[/red]")
+    elif result.rooms_checked:
+        _render_status_table(result, f"{prop_config.display_name} Status")
 
     return result
 
 
+def _render_status_table(result: CheckResult, title: str) -> None:
+    """Print a table of every room in a check result."""
+    table = Table(title=title, show_header=True)
+    table.add_column("Room")
+    table.add_column("Check-in")
+    table.add_column("Status")
+    table.add_column("Price")
+    table.add_column("Private Onsen")
+    for row in map(_fmt_room, result.rooms_checked):
+        table.add_row(*row)
+    console.print(table)
+
+
+def _fmt_room(room: RoomAvailability) -> tuple[str, str, str, str, str]:
+    """Format one room as a status table row."""
+    price = room.price_per_person
+    return (
+        room.room.display_name,
+        room.check_in.isoformat(),
+        _STATUS_AVAILABLE if room.available else _STATUS_UNAVAILABLE,
+        format(price, ",") if price else "-",
+        _ONSEN_YES if room.room.has_private_onsen else _ONSEN_NO,
+    )
+
+
 async def _single_check_all(config: Config) -> list[CheckResult]:
     """Run a single availability check for all properties."""
-    log(f"Single check for {config.check_in_date} ({config.nights} night(s))")
+    log(f"Single check for {_format_dates(config)} ({config.nights} night(s))")
+
+    scrape_limit = asyncio.BoundedSemaphore(config.max_concurrent_scrapers)
+
+    async def check_one(prop: Property) -> CheckResult:
+        # Hold the slot for the context's whole lifetime, launch included
+        async with scrape_limit, get_property_config(prop).scraper_class(config) as scraper:
+            return await _run_check(prop, scraper)
+
+    # Properties are independent, so scrape them all at once
+    try:
+        outcomes = await asyncio.gather(
+            *(check_one(prop) for prop in config.properties),
+            return_exceptions=True,
+        )
+    finally:
+        # Every scraper has closed its context by now
+        await browser.shutdown()
 
     results = []
-    for prop in config.properties:
-        prop_config = get_property_config(prop)
-        scraper_class = prop_config.scraper_class
-
-        async with scraper_class(config) as scraper:
-            result = await scraper.check_availability()
-            results.append(result)
-
-        if result.error:
-            log(f"[red]Error for {prop.value}: {result.error}[/red]")
-        elif result.rooms_checked:
-            table = Table(title=f"{prop_config.display_name} Availability", show_header=True)
-            table.add_column("Room")
-            table.add_column("Status")
-            table.add_column("Price")
-            table.add_column("Private Onsen")
-            for room in result.rooms_checked:
-                status = "[green]Available[/green]" if room.available else "[red]Unavailable[/red]"
-                price = f"{room.price_per_person:,}" if room.price_per_person else "-"
-                onsen = "[green]Yes[/green]" if room.room.has_private_onsen else "[dim]No[/dim]"
-                table.add_row(room.room.display_name, status, price, onsen)
-            console.print(table)
+    for prop, result in zip(config.properties, outcomes):
+        if isinstance(result, Exception):
+            log(f"[red]Error for {prop.value}: {result}[/red]")
+            # Keep the failure so the exit code reflects it
+            result = CheckResult(
+                property=prop,
+                check_time=datetime.now().isoformat(),
+                rooms_checked=[],
+                error=str(result),
+            )
+        results.append(result)
 
     return results
 
@@ -214,7 +325,7 @@ def check(
         str,
         typer.Option(
             "--date", "-d",
-            help="Check-in date (YYYY-MM-DD)",
+            help="Check-in date(s) (YYYY-MM-DD, comma-separated for several)",
         ),
     ],
     property: Annotated[
@@ -331,12 +442,6 @@ def check(
     ] = False,
 ) -> None:
     """Check room availability at Japanese ryokan."""
-    try:
-        check_in_date = date.fromisoformat(check_date)
-    except ValueError:
-        console.print(f"[red]Invalid date format: {check_date}. Use YYYY-MM-DD[/red]")
-        raise typer.Exit(1)
-
     properties = parse_properties(property)
 
     # Parse room filter per property
@@ -367,8 +472,8 @@ def check(
         )
 
     try:
-        config = Config(
-            check_in_date=check_in_date,
+        config = Config.from_cli(
+            check_date,
             properties=properties,
             nights=nights,
             guests=guests,
@@ -383,12 +488,12 @@ def check(
         raise typer.Exit(1)
 
     if once:
-        results = asyncio.run(_single_check_all(config))
+        results = run_async(_single_check_all(config))
         has_error = any(r.error for r in results)
         raise typer.Exit(1 if has_error else 0)
     else:
         try:
-            asyncio.run(run_check_loop(config))
+            run_async(run_check_loop(config))
         except KeyboardInterrupt:
             log("Shutting down...")
             raise typer.Exit(0)
@@ -405,10 +510,6 @@ def rooms(
     ] = "all",
 ) -> None:
     """List available room types for a property."""
-    # Import properties to ensure registration
-    import ryokan_check.properties.miyakowasure  # noqa: F401
-    import ryokan_check.properties.miyamaso  # noqa: F401
-
     properties = parse_properties(property)
 
     for prop in properties:
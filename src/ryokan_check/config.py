@@ -1,9 +1,10 @@
 """Configuration for ryokan availability checker."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import date, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from ryokan_check.domain.property import Property, get_property_config
 from ryokan_check.notifier import EmailConfig
@@ -15,11 +16,13 @@ if TYPE_CHECKING:
 DEFAULT_STATE_DIR = Path.home() / ".ryokan-check"
 
 
-@dataclass
+@dataclass(frozen=True)
 class Config:
-    """Application configuration."""
+    """Application configuration, validated once and immutable afterwards."""
 
     check_in_date: date
+    # Every check-in date to monitor; check_in_date is always the first
+    check_in_dates: list[date] = field(default_factory=list)
     properties: list[Property] = field(default_factory=lambda: list(Property))
     nights: int = 1
     guests: int = 2
@@ -28,6 +31,9 @@ class Config:
     email_config: EmailConfig | None = None
     state_dir: Path = field(default_factory=lambda: DEFAULT_STATE_DIR)
     headless: bool = True
+    # Properties scraped at the same time (each in its own context on one shared browser)
+    max_concurrent_scrapers: int = 2
+    check_out_date: date = field(init=False)
 
     def __post_init__(self) -> None:
         if self.nights < 1:
@@ -36,13 +42,27 @@ class Config:
             raise ValueError("guests must be at least 1")
         if self.check_interval_minutes < 15:
             raise ValueError("check_interval_minutes must be at least 15 (be respectful to the ryokan)")
+        if self.max_concurrent_scrapers < 1:
+            raise ValueError("max_concurrent_scrapers must be at least 1")
+        # Frozen, so derived fields are set through object.__setattr__
+        dates = list(dict.fromkeys([self.check_in_date, *self.check_in_dates]))
+        object.__setattr__(self, "check_in_dates", dates)
+        object.__setattr__(self, "check_out_date", self.check_out_for(self.check_in_date))
 
-    @property
-    def check_out_date(self) -> date:
-        """Calculate check-out date from check-in and nights."""
-        return self.check_in_date + timedelta(days=self.nights)
+    @classmethod
+    def from_cli(cls, check_dates: str, **kwargs: Any) -> "Config":
+        """Build a config from a comma-separated list of YYYY-MM-DD check-in dates."""
+        try:
+            dates = [date.fromisoformat(d.strip()) for d in check_dates.split(",")]
+        except ValueError:
+            raise ValueError(f"Invalid date format: {check_dates}. Use YYYY-MM-DD") from None
+        return cls(check_in_date=dates[0], check_in_dates=dates, **kwargs)
 
-    def rooms_to_check(self, prop: Property) -> list["RoomInfo"]:
+    def check_out_for(self, check_in: date) -> date:
+        """Calculate check-out date for a given check-in date."""
+        return check_in + timedelta(days=self.nights)
+
+    def rooms_to_check(self, prop: Property) -> Sequence["RoomInfo"]:
         """Return rooms to check for a specific property."""
         if prop in self.room_filter and self.room_filter[prop]:
             return self.room_filter[prop]
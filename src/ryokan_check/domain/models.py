@@ -1,18 +1,34 @@
 """Core domain models for availability checking."""
 
+import hashlib
 from dataclasses import dataclass
 from datetime import date
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from ryokan_check.domain.property import Property, get_property_config
 
 if TYPE_CHECKING:
+    from ryokan_check.domain.property import PropertyConfig
     from ryokan_check.ports.room import RoomInfo
 
+_ONSEN_NOTE = "\nPrivate onsen bath in room!"
 
-@dataclass
+_NOTIFICATION_TEMPLATE = (
+    "{header}{onsen_note}\n\n"
+    "Room: {room}\n"
+    "Date: {check_in} -> {check_out}\n"
+    "Price: {price}{spots}\n\n"
+    "Book now: {url}"
+)
+
+
+@dataclass(frozen=True)
 class RoomAvailability:
-    """Represents availability status for a specific room and date."""
+    """Represents availability status for a specific room and date.
+
+    Frozen, so derived values are computed once and cached on the instance.
+    """
 
     property: Property
     room: "RoomInfo"
@@ -22,31 +38,49 @@ class RoomAvailability:
     price_per_person: int | None = None
     spots_left: int | None = None
 
-    @property
+    @cached_property
+    def property_config(self) -> "PropertyConfig":
+        """Registered configuration of this room's property."""
+        return get_property_config(self.property)
+
+    @cached_property
     def booking_url(self) -> str:
         """Generate direct booking URL for this room."""
-        config = get_property_config(self.property)
-        return config.booking_url_template.format(
+        return self.property_config.booking_url_template.format(
             room_id=self.room.room_id,
             date=self.check_in.isoformat(),
         )
 
+    @cached_property
+    def notification_key(self) -> str:
+        """Key identifying the notified property+room+date+price payload.
+
+        The price is part of the key so a price change is notified again
+        even within the cooldown.
+        """
+        payload = (
+            f"{self.property.value}|{self.room.room_id}|{self.check_in}|{self.check_out}"
+            f"|{self.price_per_person}"
+        )
+        return hashlib.md5(payload.encode(), usedforsecurity=False).hexdigest()
+
     def notification_message(self) -> str:
         """Format availability as notification message."""
-        config = get_property_config(self.property)
         price_str = f"{self.price_per_person:,}/person" if self.price_per_person else "Price TBD"
         spots_str = f" ({self.spots_left} left)" if self.spots_left else ""
+        onsen_note = _ONSEN_NOTE if self.room.has_private_onsen else ""
 
-        onsen_note = ""
-        if self.room.has_private_onsen:
-            onsen_note = "\nPrivate onsen bath in room!"
-
-        return (
-            f"Room available at {config.display_name}!{onsen_note}\n\n"
-            f"Room: {self.room.display_name}\n"
-            f"Date: {self.check_in} -> {self.check_out}\n"
-            f"Price: {price_str}{spots_str}\n\n"
-            f"Book now: {self.booking_url}"
+        return _NOTIFICATION_TEMPLATE.format_map(
+            {
+                "header": self.property_config.notification_header,
+                "onsen_note": onsen_note,
+                "room": self.room.display_name,
+                "check_in": self.check_in,
+                "check_out": self.check_out,
+                "price": price_str,
+                "spots": spots_str,
+                "url": self.booking_url,
+            }
         )
 
 
@@ -1,8 +1,9 @@
 """Property enum and configuration registry."""
 
-from dataclasses import dataclass
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ryokan_check.ports.room import RoomInfo
@@ -17,21 +18,25 @@ class Property(Enum):
     @classmethod
     def from_string(cls, s: str) -> "Property | None":
         """Parse property from string (supports aliases)."""
-        aliases = {
-            "miyakowasure": cls.MIYAKOWASURE,
-            "miyamaso": cls.MIYAMASO,
-            "takamiya": cls.MIYAMASO,
-        }
-        return aliases.get(s.lower().strip())
+        return _ALIASES.get(s.strip().casefold())
 
     @property
     def display_name(self) -> str:
         """Human-readable property name."""
-        names = {
-            self.MIYAKOWASURE: "Natsuse Onsen Miyakowasure",
-            self.MIYAMASO: "Miyamaso Takamiya (Zao Onsen)",
-        }
-        return names[self]
+        return _DISPLAY_NAMES[self]
+
+
+# Lookup tables built once rather than on every call
+_ALIASES: dict[str, Property] = {
+    "miyakowasure": Property.MIYAKOWASURE,
+    "miyamaso": Property.MIYAMASO,
+    "takamiya": Property.MIYAMASO,
+}
+
+_DISPLAY_NAMES: dict[Property, str] = {
+    Property.MIYAKOWASURE: "Natsuse Onsen Miyakowasure",
+    Property.MIYAMASO: "Miyamaso Takamiya (Zao Onsen)",
+}
 
 
 @dataclass
@@ -45,15 +50,31 @@ class PropertyConfig:
     room_enum: type  # The room enum class
     scraper_class: type  # The scraper class
     state_filename: str
+    # Optional parser for filters naming several rooms at once (e.g. a room group)
+    parse_multiple: Callable[[str], list["RoomInfo"]] | None = None
+    # First line of every notification, built once per property
+    notification_header: str = field(init=False, repr=False)
+    _rooms: tuple["RoomInfo", ...] = field(init=False, repr=False)
 
-    def get_rooms(self) -> list["RoomInfo"]:
-        """Return all room types for this property."""
-        return list(self.room_enum)
+    def __post_init__(self) -> None:
+        self.notification_header = f"Room available at {self.display_name}!"
+        self._rooms = tuple(self.room_enum)
+
+    def get_rooms(self) -> Sequence["RoomInfo"]:
+        """Return all room types for this property (shared, read-only)."""
+        return self._rooms
 
     def parse_room(self, s: str) -> "RoomInfo | None":
         """Parse room string for this property."""
         return self.room_enum.from_string(s)
 
+    def parse_rooms(self, s: str) -> list["RoomInfo"]:
+        """Parse a room filter entry into the rooms it names (empty if unknown)."""
+        if self.parse_multiple is not None:
+            return self.parse_multiple(s)
+        room = self.parse_room(s)
+        return [room] if room else []
+
 
 # Registry populated at module load by property modules
 PROPERTY_CONFIGS: dict[Property, PropertyConfig] = {}
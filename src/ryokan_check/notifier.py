@@ -1,5 +1,9 @@
 """Notification services for availability alerts."""
 
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
@@ -11,6 +15,17 @@ if TYPE_CHECKING:
     from ryokan_check.domain.models import RoomAvailability
     from ryokan_check.domain.property import PropertyConfig
 
+# Seconds to wait on any single SMTP operation
+SMTP_TIMEOUT = 30.0
+# Reconnect instead of reusing a connection idle this long; servers commonly
+# drop idle clients after about five minutes, which would cost a failed send
+SMTP_KEEPALIVE_EXPIRY = 300.0
+# Identical notifications within this window are sent only once
+DEDUP_TTL_SECONDS = 2 * 3600
+DEDUP_MAX_ENTRIES = 1024
+# Emails in flight at once, so a burst of alerts can't open a connection storm
+MAX_CONCURRENT_SENDS = 4
+
 
 @dataclass
 class EmailConfig:
@@ -26,10 +41,42 @@ class EmailConfig:
 
 
 class EmailNotifier:
-    """Send notifications via email using SMTP."""
+    """Send notifications via email using SMTP.
+
+    Use as an async context manager to keep a single SMTP connection open
+    across sends instead of reconnecting (and renegotiating TLS) per email.
+    The connection is opened lazily by the first send, so runs that never
+    notify never touch the server. Outside a context, each send opens its
+    own connection.
+    """
 
     def __init__(self, config: EmailConfig) -> None:
         self.config = config
+        self._smtp: aiosmtplib.SMTP | None = None
+        self._connect_lock = asyncio.Lock()
+        self._send_limit = asyncio.BoundedSemaphore(MAX_CONCURRENT_SENDS)
+        self._last_used = 0.0
+        # Digest of subject+body -> monotonic time it was sent, oldest first
+        self._sent_digests: OrderedDict[str, float] = OrderedDict()
+
+    async def __aenter__(self) -> "EmailNotifier":
+        self._smtp = aiosmtplib.SMTP(
+            hostname=self.config.smtp_host,
+            port=self.config.smtp_port,
+            username=self.config.smtp_user,
+            password=self.config.smtp_password,
+            start_tls=self.config.use_tls,
+            timeout=SMTP_TIMEOUT,
+        )
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        if self._smtp and self._smtp.is_connected:
+            try:
+                await self._smtp.quit()
+            except aiosmtplib.SMTPException:
+                self._smtp.close()
+        self._smtp = None
 
     async def send(self, room: "RoomAvailability", prop_config: "PropertyConfig") -> bool:
         """Send notification for available room. Returns True if successful."""
@@ -41,14 +88,20 @@ class EmailNotifier:
         else:
             subject = f"{prop_config.display_name}: {room.room.display_name} Available!"
 
+        # Plain text version
+        text_body = f"{message}\n\nBook now: {room.booking_url}"
+
+        # Skip the round-trip for a payload that already went out recently
+        digest = hashlib.md5(f"{subject}|{text_body}".encode(), usedforsecurity=False).hexdigest()
+        if self._recently_sent(digest):
+            return True
+
         # Build email
         msg = MIMEMultipart("alternative")
         msg["Subject"] = subject
         msg["From"] = self.config.from_address
         msg["To"] = self.config.to_address
 
-        # Plain text version
-        text_body = f"{message}\n\nBook now: {room.booking_url}"
         msg.attach(MIMEText(text_body, "plain"))
 
         # HTML version
@@ -63,18 +116,20 @@ class EmailNotifier:
         """
         msg.attach(MIMEText(html_body, "html"))
 
-        try:
-            await aiosmtplib.send(
-                msg,
-                hostname=self.config.smtp_host,
-                port=self.config.smtp_port,
-                username=self.config.smtp_user,
-                password=self.config.smtp_password,
-                start_tls=self.config.use_tls,
-            )
-            return True
-        except aiosmtplib.SMTPException:
+        if not await self._deliver(msg):
             return False
+        self._sent_digests[digest] = time.monotonic()
+        self._sent_digests.move_to_end(digest)
+        if len(self._sent_digests) > DEDUP_MAX_ENTRIES:
+            self._sent_digests.popitem(last=False)
+        return True
+
+    def _recently_sent(self, digest: str) -> bool:
+        """Evict expired digests and report whether digest is still live."""
+        cutoff = time.monotonic() - DEDUP_TTL_SECONDS
+        while self._sent_digests and next(iter(self._sent_digests.values())) < cutoff:
+            self._sent_digests.popitem(last=False)
+        return digest in self._sent_digests
 
     async def send_status(self, message: str, title: str = "Ryokan Status") -> bool:
         """Send a status/info notification."""
@@ -85,15 +140,47 @@ class EmailNotifier:
 
         msg.attach(MIMEText(message, "plain"))
 
+        return await self._deliver(msg)
+
+    async def _deliver(self, msg: MIMEMultipart) -> bool:
+        """Send a message, reusing the open connection when there is one."""
+        async with self._send_limit:
+            return await self._deliver_now(msg)
+
+    async def _deliver_now(self, msg: MIMEMultipart) -> bool:
+        """Send a message without waiting for a send slot."""
         try:
-            await aiosmtplib.send(
-                msg,
-                hostname=self.config.smtp_host,
-                port=self.config.smtp_port,
-                username=self.config.smtp_user,
-                password=self.config.smtp_password,
-                start_tls=self.config.use_tls,
-            )
+            if self._smtp is None:
+                await aiosmtplib.send(
+                    msg,
+                    hostname=self.config.smtp_host,
+                    port=self.config.smtp_port,
+                    username=self.config.smtp_user,
+                    password=self.config.smtp_password,
+                    start_tls=self.config.use_tls,
+                    timeout=SMTP_TIMEOUT,
+                )
+                return True
+
+            await self._ensure_connected(self._smtp)
+            try:
+                await self._smtp.send_message(msg)
+            except aiosmtplib.SMTPServerDisconnected:
+                # Server dropped the idle connection; reconnect once and retry
+                await self._ensure_connected(self._smtp)
+                await self._smtp.send_message(msg)
+            self._last_used = time.monotonic()
             return True
         except aiosmtplib.SMTPException:
             return False
+
+    async def _ensure_connected(self, smtp: aiosmtplib.SMTP) -> None:
+        """(Re)connect the shared SMTP client if the connection was lost or stale."""
+        async with self._connect_lock:
+            if smtp.is_connected and time.monotonic() - self._last_used > SMTP_KEEPALIVE_EXPIRY:
+                # Likely already dropped server-side; start fresh rather than
+                # finding out from a failed send
+                smtp.close()
+            if not smtp.is_connected:
+                await smtp.connect()
+                self._last_used = time.monotonic()
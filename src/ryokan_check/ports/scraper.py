@@ -18,3 +18,8 @@ class AvailabilityScraper(Protocol):
 
     async def __aexit__(self, *args) -> None:
         ...
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Release resources shared across scraper instances."""
+        ...
@@ -1,6 +1,12 @@
 """Property-specific implementations."""
 
-# Import property modules to trigger registration
-from ryokan_check.properties import miyakowasure, miyamaso
+import functools
 
-__all__ = ["miyakowasure", "miyamaso"]
+
+@functools.cache
+def register_all() -> None:
+    """Import every property module so each registers its config; runs once."""
+    from ryokan_check.properties import miyakowasure, miyamaso  # noqa: F401
+
+
+__all__ = ["register_all"]
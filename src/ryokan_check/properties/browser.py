@@ -0,0 +1,37 @@
+"""Shared Playwright browser for the property scrapers.
+
+Launching Chromium is the slowest part of a check, so every scraper opens its
+own context off one browser that stays up until shutdown() is called.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from playwright.async_api import Browser, Playwright, async_playwright
+
+_lock = asyncio.Lock()
+_playwright: Playwright | None = None
+_browser: Browser | None = None
+
+
+async def get_browser(headless: bool = True) -> Browser:
+    """Return the shared browser, launching it on first use."""
+    global _playwright, _browser
+    async with _lock:
+        if _browser is None or not _browser.is_connected():
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(headless=headless)
+        return _browser
+
+
+async def shutdown() -> None:
+    """Close the shared browser and stop Playwright, if they were started."""
+    global _playwright, _browser
+    async with _lock:
+        if _browser:
+            await _browser.close()
+        if _playwright:
+            await _playwright.stop()
+        _playwright = _browser = None
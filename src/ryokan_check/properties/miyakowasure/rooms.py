@@ -4,38 +4,35 @@ from enum import Enum
 
 
 class MiyakowasureRoom(Enum):
-    """Room types available at Miyakowasure."""
+    """Room types available at Miyakowasure.
 
-    TSUBAKI_VIEW = "00008"
-    MOMIJI_VIP = "00006"
-    MOMIJI_TWIN = "00007"
-    MOMIJI_RIVER = "00005"
-    SAKURA_RIVER = "00001"
-    TSUBAKI_TOILET = "00002"
+    Each member is (room ID, display name, max guests, base price); the
+    enum value stays the room ID.
+    """
+
+    TSUBAKI_VIEW = ("00008", "TSUBAKI-KAN (Room with a view)", 3, 29000)
+    MOMIJI_VIP = ("00006", "MOMIJI-KAN VIP ROOM", 4, 30000)
+    MOMIJI_TWIN = ("00007", "MOMIJI-KAN Western twin bed", 2, 27000)
+    MOMIJI_RIVER = ("00005", "MOMIJI-KAN (river view)", 2, 27000)
+    SAKURA_RIVER = ("00001", "SAKURA-KAN (river view)", 3, 25000)
+    TSUBAKI_TOILET = ("00002", "TSUBAKI-KAN (private toilet)", 2, 19500)
+
+    _display_name: str
+    _max_guests: int
+    _base_price: int
+
+    def __new__(cls, room_id: str, display_name: str, max_guests: int, base_price: int):
+        member = object.__new__(cls)
+        member._value_ = room_id
+        member._display_name = display_name
+        member._max_guests = max_guests
+        member._base_price = base_price
+        return member
 
     @classmethod
     def from_string(cls, s: str) -> "MiyakowasureRoom | None":
         """Parse room type from user-friendly string."""
-        mapping = {
-            "tsubaki-view": cls.TSUBAKI_VIEW,
-            "tsubaki_view": cls.TSUBAKI_VIEW,
-            "momiji-vip": cls.MOMIJI_VIP,
-            "momiji_vip": cls.MOMIJI_VIP,
-            "vip": cls.MOMIJI_VIP,
-            "momiji-twin": cls.MOMIJI_TWIN,
-            "momiji_twin": cls.MOMIJI_TWIN,
-            "twin": cls.MOMIJI_TWIN,
-            "momiji-river": cls.MOMIJI_RIVER,
-            "momiji_river": cls.MOMIJI_RIVER,
-            "momiji": cls.MOMIJI_RIVER,
-            "sakura-river": cls.SAKURA_RIVER,
-            "sakura_river": cls.SAKURA_RIVER,
-            "sakura": cls.SAKURA_RIVER,
-            "tsubaki-toilet": cls.TSUBAKI_TOILET,
-            "tsubaki_toilet": cls.TSUBAKI_TOILET,
-            "tsubaki": cls.TSUBAKI_TOILET,
-        }
-        return mapping.get(s.lower().strip())
+        return _FROM_STRING.get(s.strip().casefold())
 
     @property
     def room_id(self) -> str:
@@ -45,28 +42,12 @@ class MiyakowasureRoom(Enum):
     @property
     def display_name(self) -> str:
         """Human-readable room name."""
-        names = {
-            self.TSUBAKI_VIEW: "TSUBAKI-KAN (Room with a view)",
-            self.MOMIJI_VIP: "MOMIJI-KAN VIP ROOM",
-            self.MOMIJI_TWIN: "MOMIJI-KAN Western twin bed",
-            self.MOMIJI_RIVER: "MOMIJI-KAN (river view)",
-            self.SAKURA_RIVER: "SAKURA-KAN (river view)",
-            self.TSUBAKI_TOILET: "TSUBAKI-KAN (private toilet)",
-        }
-        return names[self]
+        return self._display_name
 
     @property
     def max_guests(self) -> int:
         """Maximum number of guests for this room."""
-        limits = {
-            self.TSUBAKI_VIEW: 3,
-            self.MOMIJI_VIP: 4,
-            self.MOMIJI_TWIN: 2,
-            self.MOMIJI_RIVER: 2,
-            self.SAKURA_RIVER: 3,
-            self.TSUBAKI_TOILET: 2,
-        }
-        return limits[self]
+        return self._max_guests
 
     @property
     def has_private_onsen(self) -> bool:
@@ -76,12 +57,26 @@ class MiyakowasureRoom(Enum):
     @property
     def base_price(self) -> int:
         """Base price per person."""
-        prices = {
-            self.TSUBAKI_VIEW: 29000,
-            self.MOMIJI_VIP: 30000,
-            self.MOMIJI_TWIN: 27000,
-            self.MOMIJI_RIVER: 27000,
-            self.SAKURA_RIVER: 25000,
-            self.TSUBAKI_TOILET: 19500,
-        }
-        return prices[self]
+        return self._base_price
+
+
+# Alias table built once at import instead of on every call
+_FROM_STRING: dict[str, MiyakowasureRoom] = {
+    "tsubaki-view": MiyakowasureRoom.TSUBAKI_VIEW,
+    "tsubaki_view": MiyakowasureRoom.TSUBAKI_VIEW,
+    "momiji-vip": MiyakowasureRoom.MOMIJI_VIP,
+    "momiji_vip": MiyakowasureRoom.MOMIJI_VIP,
+    "vip": MiyakowasureRoom.MOMIJI_VIP,
+    "momiji-twin": MiyakowasureRoom.MOMIJI_TWIN,
+    "momiji_twin": MiyakowasureRoom.MOMIJI_TWIN,
+    "twin": MiyakowasureRoom.MOMIJI_TWIN,
+    "momiji-river": MiyakowasureRoom.MOMIJI_RIVER,
+    "momiji_river": MiyakowasureRoom.MOMIJI_RIVER,
+    "momiji": MiyakowasureRoom.MOMIJI_RIVER,
+    "sakura-river": MiyakowasureRoom.SAKURA_RIVER,
+    "sakura_river": MiyakowasureRoom.SAKURA_RIVER,
+    "sakura": MiyakowasureRoom.SAKURA_RIVER,
+    "tsubaki-toilet": MiyakowasureRoom.TSUBAKI_TOILET,
+    "tsubaki_toilet": MiyakowasureRoom.TSUBAKI_TOILET,
+    "tsubaki": MiyakowasureRoom.TSUBAKI_TOILET,
+}
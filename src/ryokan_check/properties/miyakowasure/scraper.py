@@ -4,13 +4,15 @@ from __future__ import annotations
 
 import asyncio
 import re
-from datetime import datetime
+from datetime import date, datetime
 from typing import TYPE_CHECKING
 
-from playwright.async_api import Browser, Page, async_playwright
+from playwright.async_api import BrowserContext, Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from ryokan_check.domain.models import CheckResult, RoomAvailability
 from ryokan_check.domain.property import Property
+from ryokan_check.properties import browser
 from ryokan_check.properties.miyakowasure.rooms import MiyakowasureRoom
 
 if TYPE_CHECKING:
@@ -18,98 +20,161 @@ if TYPE_CHECKING:
 
 PLAN_LIST_URL = "https://www3.yadosys.com/reserve/en/plan/list/147/fgeggchbebhjhbeogefegpdn/all"
 
+SEARCH_FORM_SELECTOR = 'select[name*="year"], select[id*="year"]'
+# How long to wait for the form / results to render before parsing what's there
+RENDER_TIMEOUT_MS = 30000
+
+UNAVAILABLE_MARKERS = ("×", "満室", "sold out", "unavailable", "no vacancy")
+AVAILABLE_MARKERS = ("○", "◎", "空室", "available", "vacancy")
+
+# Patterns are compiled once at import rather than on every check.
+# One alternation finds the first marker of either kind in a single pass; the
+# leftmost match wins, so "unavailable" is never read as "available".
+_MARKER_RE = re.compile(
+    "|".join(re.escape(marker) for marker in UNAVAILABLE_MARKERS + AVAILABLE_MARKERS),
+    re.IGNORECASE,
+)
+_AVAILABLE_SET = frozenset(marker.lower() for marker in AVAILABLE_MARKERS)
+_NAME_RES: dict[MiyakowasureRoom, re.Pattern[str]] = {
+    room: re.compile(re.escape(room.display_name), re.IGNORECASE) for room in MiyakowasureRoom
+}
+# Price near the room name (either side), then any price at all
+_PRICE_RES: dict[MiyakowasureRoom, list[re.Pattern[str]]] = {
+    room: [
+        re.compile(rf"{re.escape(room.display_name)}.*?[¥￥]([0-9,]+)", re.IGNORECASE | re.DOTALL),
+        re.compile(rf"[¥￥]([0-9,]+).*?{re.escape(room.display_name)}", re.IGNORECASE | re.DOTALL),
+        re.compile(r"[¥￥]([0-9,]+)"),
+    ]
+    for room in MiyakowasureRoom
+}
+_SPOTS_RE = re.compile(r"(\d+)\s*(?:rooms?|left|remaining|組|室)", re.IGNORECASE)
+
+# Fill every search field in one round-trip. Selects match an option by value
+# or label (like Playwright's select_option); missing fields are skipped.
+_FILL_FORM_JS = """
+(fields) => {
+    for (const [selector, value] of fields) {
+        const el = document.querySelector(selector);
+        if (!el) continue;
+        if (el.tagName === "SELECT") {
+            const option = Array.from(el.options).find(
+                (o) => o.value === value || o.label.trim() === value
+            );
+            if (!option) continue;
+            el.value = option.value;
+        } else {
+            el.value = value;
+        }
+        el.dispatchEvent(new Event("input", { bubbles: true }));
+        el.dispatchEvent(new Event("change", { bubbles: true }));
+    }
+}
+"""
+
+# Text of the results row holding a room's link, or null if it isn't on the page
+_ROOM_SECTION_JS = """
+(roomId) => {
+    const el = document.querySelector(`[href*="${roomId}"], [data-room*="${roomId}"]`);
+    return el ? (el.closest("tr") || el.parentElement || el).innerText : null;
+}
+"""
+
 
 class YadosysScraper:
     """Scrapes availability from Yadosys booking system."""
 
     def __init__(self, config: "Config") -> None:
         self.config = config
-        self._browser: Browser | None = None
-        self._playwright = None
+        self._context: BrowserContext | None = None
 
     async def __aenter__(self) -> "YadosysScraper":
-        self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(headless=self.config.headless)
+        await self._ensure_context()
         return self
 
     async def __aexit__(self, *args) -> None:
-        if self._browser:
-            await self._browser.close()
-        if self._playwright:
-            await self._playwright.stop()
+        # The browser is shared and outlives this scraper; see shutdown()
+        if self._context:
+            await self._context.close()
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Close the browser shared by all scrapers."""
+        await browser.shutdown()
+
+    async def _ensure_context(self) -> BrowserContext:
+        """Return a live context, reopening it if it or the shared browser went away."""
+        shared = await browser.get_browser(headless=self.config.headless)
+        if self._context is None or self._context.browser is not shared:
+            # One context for all checks, so cookies and cache carry over
+            context = await shared.new_context()
+            context.on("close", self._forget_context)
+            self._context = context
+        return self._context
+
+    def _forget_context(self, context: BrowserContext) -> None:
+        """Drop a closed context so the next check opens a fresh one."""
+        if self._context is context:
+            self._context = None
 
     async def check_availability(self) -> CheckResult:
         """Check availability for configured dates and rooms."""
         check_time = datetime.now().isoformat()
 
-        if not self._browser:
-            return CheckResult(
-                property=Property.MIYAKOWASURE,
-                check_time=check_time,
-                rooms_checked=[],
-                error="Browser not initialized",
-            )
-
         try:
-            page = await self._browser.new_page()
-            page.set_default_timeout(60000)
-
-            await page.goto(PLAN_LIST_URL, wait_until="networkidle")
-            await asyncio.sleep(2)
-
-            await self._fill_search_form(page)
-            await self._submit_and_wait(page)
-
-            rooms = await self._parse_availability(page)
-            await page.close()
+            # The loop reuses this scraper, so recover from a crashed browser
+            await self._ensure_context()
+            # One page per date off the shared context, all searched at once
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(self._check_one(check_in))
+                    for check_in in self.config.check_in_dates
+                ]
 
             return CheckResult(
                 property=Property.MIYAKOWASURE,
                 check_time=check_time,
-                rooms_checked=rooms,
+                rooms_checked=[room for task in tasks for room in task.result()],
             )
 
         except Exception as e:
+            errors = e.exceptions if isinstance(e, ExceptionGroup) else (e,)
             return CheckResult(
                 property=Property.MIYAKOWASURE,
                 check_time=check_time,
                 rooms_checked=[],
-                error=str(e),
+                error="; ".join(str(error) for error in errors),
             )
 
-    async def _fill_search_form(self, page: Page) -> None:
-        """Fill in the search form with target dates and guest count."""
-        check_in = self.config.check_in_date
+    async def _check_one(self, check_in: date) -> list[RoomAvailability]:
+        """Search a single check-in date on its own page."""
+        page = await self._context.new_page()
+        page.set_default_timeout(60000)
 
-        year_select = page.locator('select[name*="year"], select[id*="year"]').first
-        month_select = page.locator('select[name*="month"], select[id*="month"]').first
-        day_select = page.locator('select[name*="day"], select[id*="day"]').first
-
-        if await year_select.count() > 0:
-            await year_select.select_option(str(check_in.year))
-        if await month_select.count() > 0:
-            await month_select.select_option(str(check_in.month))
-        if await day_select.count() > 0:
-            await day_select.select_option(str(check_in.day))
-
-        nights_select = page.locator('select[name*="night"], select[name*="stay"]').first
-        if await nights_select.count() > 0:
-            await nights_select.select_option(str(self.config.nights))
+        # The context outlives this check, so always release the page
+        try:
+            await page.goto(PLAN_LIST_URL, wait_until="domcontentloaded")
+            await self._wait_for(page, SEARCH_FORM_SELECTOR)
 
-        male_input = page.locator('select[name*="male"], input[name*="male"]').first
-        female_input = page.locator('select[name*="female"], input[name*="female"]').first
+            await self._fill_search_form(page, check_in)
+            await self._submit_and_wait(page)
 
-        if await male_input.count() > 0:
-            if await male_input.evaluate("el => el.tagName") == "SELECT":
-                await male_input.select_option(str(self.config.guests))
-            else:
-                await male_input.fill(str(self.config.guests))
+            return await self._parse_availability(page, check_in)
+        finally:
+            await page.close()
 
-        if await female_input.count() > 0:
-            if await female_input.evaluate("el => el.tagName") == "SELECT":
-                await female_input.select_option("0")
-            else:
-                await female_input.fill("0")
+    async def _fill_search_form(self, page: Page, check_in: date) -> None:
+        """Fill in the search form with the check-in date and guest count."""
+        await page.evaluate(
+            _FILL_FORM_JS,
+            [
+                ['select[name*="year"], select[id*="year"]', str(check_in.year)],
+                ['select[name*="month"], select[id*="month"]', str(check_in.month)],
+                ['select[name*="day"], select[id*="day"]', str(check_in.day)],
+                ['select[name*="night"], select[name*="stay"]', str(self.config.nights)],
+                ['select[name*="male"], input[name*="male"]', str(self.config.guests)],
+                ['select[name*="female"], input[name*="female"]', "0"],
+            ],
+        )
 
     async def _submit_and_wait(self, page: Page) -> None:
         """Submit search form and wait for results."""
@@ -120,88 +185,94 @@ class YadosysScraper:
         ).first
 
         if await submit_btn.count() > 0:
-            await submit_btn.click()
-            await page.wait_for_load_state("networkidle")
-            await asyncio.sleep(2)
+            # Return as soon as the search response lands, so room links that
+            # happen to be on the form page can't satisfy the wait below
+            try:
+                async with page.expect_response(
+                    lambda response: "/plan/" in response.url
+                    and response.request.resource_type in ("document", "xhr", "fetch"),
+                    timeout=RENDER_TIMEOUT_MS,
+                ):
+                    await submit_btn.click()
+            except PlaywrightTimeoutError:
+                pass
+
+            room_links = ", ".join(
+                f'[href*="{room.room_id}"], [data-room*="{room.room_id}"]'
+                for room in self.config.rooms_to_check(Property.MIYAKOWASURE)
+            )
+            await self._wait_for(page, room_links)
 
-    async def _parse_availability(self, page: Page) -> list[RoomAvailability]:
-        """Parse room availability from the results page."""
-        results: list[RoomAvailability] = []
-        rooms_to_check = self.config.rooms_to_check(Property.MIYAKOWASURE)
+    async def _wait_for(self, page: Page, selector: str) -> None:
+        """Wait until selector renders; on timeout, carry on with what's there."""
+        try:
+            await page.wait_for_selector(selector, timeout=RENDER_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            pass
 
-        content = await page.content()
+    async def _parse_availability(self, page: Page, check_in: date) -> list[RoomAvailability]:
+        """Parse room availability from the results page."""
+        rooms = [
+            room
+            for room in self.config.rooms_to_check(Property.MIYAKOWASURE)
+            if isinstance(room, MiyakowasureRoom)
+        ]
+
+        # Per-room row lookups are independent, so overlap their round-trips
+        rows: list[str | None] = await asyncio.gather(
+            *(page.evaluate(_ROOM_SECTION_JS, room.room_id) for room in rooms)
+        )
 
-        for room in rooms_to_check:
-            if not isinstance(room, MiyakowasureRoom):
-                continue
-            availability = await self._check_room_availability(page, content, room)
-            if availability:
-                results.append(availability)
+        # Serializing the whole page is only needed for rooms without a row
+        content = ""
+        if not all(rows):
+            content = await page.content()
 
+        results: list[RoomAvailability] = []
+        for room, row in zip(rooms, rows):
+            if row:
+                results.append(self._check_room_availability(row, room, check_in))
+            elif room.room_id in content or _NAME_RES[room].search(content):
+                results.append(self._check_room_availability(content, room, check_in))
         return results
 
-    async def _check_room_availability(
-        self, page: Page, content: str, room_type: MiyakowasureRoom
-    ) -> RoomAvailability | None:
-        """Check availability for a specific room type."""
-        room_name = room_type.display_name
-        room_id = room_type.value
-
+    def _check_room_availability(
+        self, text: str, room_type: MiyakowasureRoom, check_in: date
+    ) -> RoomAvailability:
+        """Check availability for a specific room type in its row (or page) text."""
         is_available = False
         price: int | None = None
         spots_left: int | None = None
 
-        room_section = page.locator(f'[href*="{room_id}"], [data-room*="{room_id}"]').first
-        if await room_section.count() == 0:
-            room_section = page.locator(f'text="{room_name}"').first
-
-        unavailable_markers = ["×", "満室", "sold out", "unavailable", "no vacancy"]
-        available_markers = ["○", "◎", "空室", "available", "vacancy"]
-
-        content_lower = content.lower()
-        room_name_lower = room_name.lower()
-
-        if room_name_lower in content_lower or room_id in content:
-            for marker in unavailable_markers:
-                pattern = f"{room_name}.*?{re.escape(marker)}|{re.escape(marker)}.*?{room_name}"
-                if re.search(pattern, content, re.IGNORECASE | re.DOTALL):
-                    is_available = False
-                    break
-            else:
-                for marker in available_markers:
-                    if marker in content:
-                        is_available = True
-                        break
+        # The first marker at or after the room's name decides its status
+        name = _NAME_RES[room_type].search(text)
+        marker = _MARKER_RE.search(text, name.start() if name else 0)
+        if marker:
+            is_available = marker.group().lower() in _AVAILABLE_SET
 
-            price_patterns = [
-                rf"{room_name}.*?[¥￥]([0-9,]+)",
-                rf"[¥￥]([0-9,]+).*?{room_name}",
-                r"[¥￥]([0-9,]+)",
-            ]
-            for pattern in price_patterns:
-                match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
-                if match:
-                    price_str = match.group(1).replace(",", "")
-                    try:
-                        price = int(price_str)
-                        if 10000 <= price <= 100000:
-                            break
-                    except ValueError:
-                        pass
-
-            spots_pattern = r"(\d+)\s*(?:rooms?|left|remaining|組|室)"
-            match = re.search(spots_pattern, content, re.IGNORECASE)
+        for pattern in _PRICE_RES[room_type]:
+            match = pattern.search(text)
             if match:
-                spots_left = int(match.group(1))
+                price_str = match.group(1).replace(",", "")
+                try:
+                    price = int(price_str)
+                    if 10000 <= price <= 100000:
+                        break
+                except ValueError:
+                    pass
+
+        match = _SPOTS_RE.search(text)
+        if match:
+            spots_left = int(match.group(1))
 
-            if not is_available and price and price > 10000:
-                is_available = True
+        if not is_available and price and price > 10000:
+            is_available = True
 
         return RoomAvailability(
             property=Property.MIYAKOWASURE,
             room=room_type,
-            check_in=self.config.check_in_date,
-            check_out=self.config.check_out_date,
+            check_in=check_in,
+            check_out=self.config.check_out_for(check_in),
             available=is_available,
             price_per_person=price,
             spots_left=spots_left,
@@ -210,5 +281,9 @@ class YadosysScraper:
 
 async def check_availability(config: "Config") -> CheckResult:
     """Convenience function to check availability."""
-    async with YadosysScraper(config) as scraper:
-        return await scraper.check_availability()
+    try:
+        async with YadosysScraper(config) as scraper:
+            return await scraper.check_availability()
+    finally:
+        await YadosysScraper.shutdown()
+
@@ -12,6 +12,7 @@ MIYAMASO_CONFIG = PropertyConfig(
     room_enum=MiyamasoRoom,
     scraper_class=BanScraper,
     state_filename="miyamaso-state.json",
+    parse_multiple=MiyamasoRoom.parse_multiple,
 )
 
 register_property(MIYAMASO_CONFIG)
@@ -8,40 +8,38 @@ class MiyamasoRoom(Enum):
 
     Only rooms with genuine natural hot spring (onsen) water in their private baths
     are included. The hotel has 9 room types total, but only these 3 have real onsen.
+
+    Each member is (room ID, display name, Japanese name); the enum value
+    stays the room ID.
     """
 
     # Detached villa with private open-air onsen (110 m2, up to 4 guests)
     # The only room in all of Zao Onsen with real in-room private onsen.
-    HINAKURA = "25112"
+    HINAKURA = ("25112", "HINAKURA Villa (Private Onsen Suite, 110m2)", "離れ・雛蔵")
 
     # Ken Okuyama designed suite with open-air onsen (51-61 m2, up to 4 guests)
     # Two variants: Maisonette (2-floor) and Japanese-style with adjoining room
-    RIAN_SANSUI_MAISONETTE = "25114"
-    RIAN_SANSUI_JAPANESE = "25113"
+    RIAN_SANSUI_MAISONETTE = (
+        "25114",
+        "Rian Sansui Maisonette (Private Onsen, 51m2)",
+        "離庵 山水 (メゾネット)",
+    )
+    RIAN_SANSUI_JAPANESE = ("25113", "Rian Sansui Japanese (Private Onsen, 51m2)", "離庵 山水 (和室)")
+
+    _display_name: str
+    _japanese_name: str
+
+    def __new__(cls, room_id: str, display_name: str, japanese_name: str):
+        member = object.__new__(cls)
+        member._value_ = room_id
+        member._display_name = display_name
+        member._japanese_name = japanese_name
+        return member
 
     @classmethod
     def from_string(cls, s: str) -> "MiyamasoRoom | None":
         """Parse room type from user-friendly string."""
-        s_lower = s.lower().strip()
-        mapping = {
-            # Hinakura aliases
-            "hinakura": cls.HINAKURA,
-            "hina": cls.HINAKURA,
-            "villa": cls.HINAKURA,
-            # Rian Sansui aliases - "rian" returns maisonette as default
-            "rian": cls.RIAN_SANSUI_MAISONETTE,
-            "rian-sansui": cls.RIAN_SANSUI_MAISONETTE,
-            "rian_sansui": cls.RIAN_SANSUI_MAISONETTE,
-            "sansui": cls.RIAN_SANSUI_MAISONETTE,
-            # Specific variants
-            "rian-maisonette": cls.RIAN_SANSUI_MAISONETTE,
-            "rian_maisonette": cls.RIAN_SANSUI_MAISONETTE,
-            "maisonette": cls.RIAN_SANSUI_MAISONETTE,
-            "rian-japanese": cls.RIAN_SANSUI_JAPANESE,
-            "rian_japanese": cls.RIAN_SANSUI_JAPANESE,
-            "rian-jp": cls.RIAN_SANSUI_JAPANESE,
-        }
-        return mapping.get(s_lower)
+        return _FROM_STRING.get(s.strip().casefold())
 
     @classmethod
     def parse_multiple(cls, s: str) -> list["MiyamasoRoom"]:
@@ -49,10 +47,10 @@ class MiyamasoRoom(Enum):
 
         When user specifies 'rian', return both Rian Sansui variants.
         """
-        s_lower = s.lower().strip()
-        if s_lower in ("rian", "rian-sansui", "rian_sansui", "sansui"):
+        key = s.strip().casefold()
+        if key in _RIAN_ALIASES:
             return [cls.RIAN_SANSUI_MAISONETTE, cls.RIAN_SANSUI_JAPANESE]
-        room = cls.from_string(s_lower)
+        room = _FROM_STRING.get(key)
         return [room] if room else []
 
     @property
@@ -63,12 +61,7 @@ class MiyamasoRoom(Enum):
     @property
     def display_name(self) -> str:
         """Human-readable room name."""
-        names = {
-            self.HINAKURA: "HINAKURA Villa (Private Onsen Suite, 110m2)",
-            self.RIAN_SANSUI_MAISONETTE: "Rian Sansui Maisonette (Private Onsen, 51m2)",
-            self.RIAN_SANSUI_JAPANESE: "Rian Sansui Japanese (Private Onsen, 51m2)",
-        }
-        return names[self]
+        return self._display_name
 
     @property
     def max_guests(self) -> int:
@@ -84,9 +77,28 @@ class MiyamasoRoom(Enum):
     @property
     def japanese_name(self) -> str:
         """Japanese name for the room."""
-        names = {
-            self.HINAKURA: "離れ・雛蔵",
-            self.RIAN_SANSUI_MAISONETTE: "離庵 山水 (メゾネット)",
-            self.RIAN_SANSUI_JAPANESE: "離庵 山水 (和室)",
-        }
-        return names[self]
+        return self._japanese_name
+
+
+# Alias tables built once at import instead of on every call.
+# _RIAN_ALIASES name the Rian Sansui suite as a whole, i.e. both variants.
+_RIAN_ALIASES: frozenset[str] = frozenset({"rian", "rian-sansui", "rian_sansui", "sansui"})
+
+_FROM_STRING: dict[str, MiyamasoRoom] = {
+    # Hinakura aliases
+    "hinakura": MiyamasoRoom.HINAKURA,
+    "hina": MiyamasoRoom.HINAKURA,
+    "villa": MiyamasoRoom.HINAKURA,
+    # Rian Sansui aliases - "rian" returns maisonette as default
+    "rian": MiyamasoRoom.RIAN_SANSUI_MAISONETTE,
+    "rian-sansui": MiyamasoRoom.RIAN_SANSUI_MAISONETTE,
+    "rian_sansui": MiyamasoRoom.RIAN_SANSUI_MAISONETTE,
+    "sansui": MiyamasoRoom.RIAN_SANSUI_MAISONETTE,
+    # Specific variants
+    "rian-maisonette": MiyamasoRoom.RIAN_SANSUI_MAISONETTE,
+    "rian_maisonette": MiyamasoRoom.RIAN_SANSUI_MAISONETTE,
+    "maisonette": MiyamasoRoom.RIAN_SANSUI_MAISONETTE,
+    "rian-japanese": MiyamasoRoom.RIAN_SANSUI_JAPANESE,
+    "rian_japanese": MiyamasoRoom.RIAN_SANSUI_JAPANESE,
+    "rian-jp": MiyamasoRoom.RIAN_SANSUI_JAPANESE,
+}
@@ -4,13 +4,15 @@ from __future__ import annotations
 
 import asyncio
 import re
-from datetime import datetime
+from datetime import date, datetime
 from typing import TYPE_CHECKING
 
-from playwright.async_api import Browser, Page, async_playwright
+from playwright.async_api import BrowserContext, Route
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from ryokan_check.domain.models import CheckResult, RoomAvailability
 from ryokan_check.domain.property import Property
+from ryokan_check.properties import browser
 from ryokan_check.properties.miyamaso.rooms import MiyamasoRoom
 
 if TYPE_CHECKING:
@@ -19,6 +21,68 @@ if TYPE_CHECKING:
 BASE_URL = "https://reserve.489ban.net/client/zao-takamiya/4"
 ROOM_LIST_URL = f"{BASE_URL}/plan/availability/room#content"
 
+# Room pages open at once, to keep the load on the booking site modest
+MAX_CONCURRENT_PAGES = 4
+# How long to wait for plan data to render before parsing what's there
+RENDER_TIMEOUT_MS = 15000
+
+# Resources that never affect the text we parse, skipped to cut load time.
+# Stylesheets still load: they decide what innerText considers visible.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+# Reasonable ryokan price range per person
+MIN_PRICE = 15000
+MAX_PRICE = 150000
+
+# True once the page shows a plausible price or a sold-out notice, i.e. plans
+# rendered. Small static fees (e.g. 入湯税150円) don't count. Called with
+# _RENDERED_ARGS, so the markers and price range come from this module.
+_RENDERED_JS = r"""
+([unavailableMarkers, minPrice, maxPrice]) => {
+    const text = document.body ? document.body.innerText : "";
+    const lower = text.toLowerCase();
+    if (unavailableMarkers.some((marker) => lower.includes(marker))) return true;
+    for (const m of text.matchAll(/([0-9,]+)\s*(?:JPY|円)|[¥￥]([0-9,]+)/gi)) {
+        const price = parseInt((m[1] || m[2]).replace(/,/g, ""), 10);
+        if (price >= minPrice && price <= maxPrice) return true;
+    }
+    return false;
+}
+"""
+
+UNAVAILABLE_MARKERS = (
+    "sold out",
+    "no vacancy",
+    "満室",
+    "完売",
+    "予約できません",
+    "this plan is sold out",
+)
+AVAILABLE_MARKERS = ("details", "reservations", "予約", "詳細", "book now", "reserve")
+
+_RENDERED_ARGS = [[marker.lower() for marker in UNAVAILABLE_MARKERS], MIN_PRICE, MAX_PRICE]
+
+# Patterns are compiled once at import rather than on every page parse.
+# One alternation finds sold-out notices and prices in a single scan;
+# IGNORECASE covers the ASCII markers without lowercasing the whole page.
+# 489ban.net shows prices like "29,700 JPY" or "¥29,700".
+_DECISION_RE = re.compile(
+    "(?P<unavailable>"
+    + "|".join(map(re.escape, UNAVAILABLE_MARKERS))
+    + r")|(?P<jpy>[0-9,]+)\s*JPY|[¥￥](?P<yen>[0-9,]+)|(?P<en>[0-9,]+)\s*円",
+    re.IGNORECASE,
+)
+# Sold-out notices alone, for the HTML fallback when the text settled nothing
+_UNAVAILABLE_RE = re.compile("|".join(map(re.escape, UNAVAILABLE_MARKERS)), re.IGNORECASE)
+# A marker is only a booking signal when it's the text of a button or link.
+# One alternation scans the original HTML once, case-insensitively.
+_BUTTON_RE = re.compile(
+    r'(?:<button[^>]*>|<a[^>]*>|class="[^"]*btn[^"]*"[^>]*>)(?:'
+    + "|".join(map(re.escape, AVAILABLE_MARKERS))
+    + ")",
+    re.IGNORECASE,
+)
+
 
 class BanScraper:
     """Scrapes availability from 489ban.net booking system (Miyamaso Takamiya).
@@ -29,47 +93,63 @@ class BanScraper:
 
     def __init__(self, config: "Config") -> None:
         self.config = config
-        self._browser: Browser | None = None
-        self._playwright = None
+        self._context: BrowserContext | None = None
+        self._page_limit = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
 
     async def __aenter__(self) -> "BanScraper":
-        self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(headless=self.config.headless)
+        await self._ensure_context()
         return self
 
     async def __aexit__(self, *args) -> None:
-        if self._browser:
-            await self._browser.close()
-        if self._playwright:
-            await self._playwright.stop()
+        # The browser is shared and outlives this scraper; see shutdown()
+        if self._context:
+            await self._context.close()
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Close the browser shared by all scrapers."""
+        await browser.shutdown()
+
+    async def _ensure_context(self) -> BrowserContext:
+        """Return a live context, reopening it if it or the shared browser went away."""
+        shared = await browser.get_browser(headless=self.config.headless)
+        if self._context is None or self._context.browser is not shared:
+            # One context for all room pages, so cache and cookies carry over;
+            # the route is registered once and applies to every page
+            context = await shared.new_context()
+            await context.route("**/*", _skip_heavy_resources)
+            context.on("close", self._forget_context)
+            self._context = context
+        return self._context
+
+    def _forget_context(self, context: BrowserContext) -> None:
+        """Drop a closed context so the next check opens a fresh one."""
+        if self._context is context:
+            self._context = None
 
     async def check_availability(self) -> CheckResult:
         """Check availability for configured dates and rooms."""
         check_time = datetime.now().isoformat()
 
-        if not self._browser:
-            return CheckResult(
-                property=Property.MIYAMASO,
-                check_time=check_time,
-                rooms_checked=[],
-                error="Browser not initialized",
-            )
-
         try:
-            results: list[RoomAvailability] = []
+            # The loop reuses this scraper, so recover from a crashed browser
+            await self._ensure_context()
             rooms_to_check = self.config.rooms_to_check(Property.MIYAMASO)
 
-            for room in rooms_to_check:
-                if not isinstance(room, MiyamasoRoom):
-                    continue
-                availability = await self._check_room_availability(room)
-                if availability:
-                    results.append(availability)
+            # Each room/date is its own page, so load them side by side
+            results = await asyncio.gather(
+                *(
+                    self._check_room_availability(room, check_in)
+                    for check_in in self.config.check_in_dates
+                    for room in rooms_to_check
+                    if isinstance(room, MiyamasoRoom)
+                )
+            )
 
             return CheckResult(
                 property=Property.MIYAMASO,
                 check_time=check_time,
-                rooms_checked=results,
+                rooms_checked=[availability for availability in results if availability],
             )
 
         except Exception as e:
@@ -80,26 +160,43 @@ class BanScraper:
                 error=str(e),
             )
 
-    async def _check_room_availability(self, room: MiyamasoRoom) -> RoomAvailability | None:
+    async def _check_room_availability(
+        self, room: MiyamasoRoom, check_in: date
+    ) -> RoomAvailability | None:
         """Check availability for a specific room by navigating to its detail page."""
-        date_str = self.config.check_in_date.strftime("%Y-%m-%d")
+        async with self._page_limit:
+            return await self._load_room_page(room, check_in)
+
+    async def _load_room_page(self, room: MiyamasoRoom, check_in: date) -> RoomAvailability:
+        """Load a room's detail page and parse its availability."""
+        date_str = check_in.strftime("%Y-%m-%d")
         url = f"{BASE_URL}/plan/room/{room.room_id}/stay?date={date_str}&roomCount=1"
 
-        page = await self._browser.new_page()
+        page = await self._context.new_page()
         page.set_default_timeout(60000)
 
         try:
-            await page.goto(url, wait_until="networkidle")
-            await asyncio.sleep(3)  # Wait for JS to render
-
-            content = await page.content()
-            is_available, price = self._parse_room_page(content)
+            await page.goto(url, wait_until="domcontentloaded")
+            try:
+                await page.wait_for_function(
+                    _RENDERED_JS, arg=_RENDERED_ARGS, timeout=RENDER_TIMEOUT_MS
+                )
+            except PlaywrightTimeoutError:
+                # Neither a price nor a sold-out notice; give scripts a moment
+                await asyncio.sleep(0.5)
+
+            # The rendered text settles most pages; the full HTML is only
+            # serialized when button markup has to decide
+            parsed = self._parse_room_text(await page.inner_text("body"))
+            if parsed is None:
+                parsed = self._parse_room_html(await page.content()), None
+            is_available, price = parsed
 
             return RoomAvailability(
                 property=Property.MIYAMASO,
                 room=room,
-                check_in=self.config.check_in_date,
-                check_out=self.config.check_out_date,
+                check_in=check_in,
+                check_out=self.config.check_out_for(check_in),
                 available=is_available,
                 price_per_person=price,
             )
@@ -108,90 +205,66 @@ class BanScraper:
             return RoomAvailability(
                 property=Property.MIYAMASO,
                 room=room,
-                check_in=self.config.check_in_date,
-                check_out=self.config.check_out_date,
+                check_in=check_in,
+                check_out=self.config.check_out_for(check_in),
                 available=False,
             )
         finally:
             await page.close()
 
-    def _parse_room_page(self, content: str) -> tuple[bool, int | None]:
-        """Parse room detail page content for availability and price.
+    def _parse_room_text(self, text: str) -> tuple[bool, int | None] | None:
+        """Parse a room page's rendered text for availability and price.
 
         Returns:
-            Tuple of (is_available, price_per_person)
+            Tuple of (is_available, price_per_person), or None when the text
+            shows neither a sold-out notice nor a plausible price
         """
-        is_available = False
+        # A sold-out notice anywhere wins, so keep scanning past prices
+        # but stop at the first notice
         price: int | None = None
-
-        content_lower = content.lower()
-
-        # Check for unavailability markers
-        unavailable_markers = [
-            "sold out",
-            "no vacancy",
-            "満室",
-            "完売",
-            "予約できません",
-            "this plan is sold out",
-        ]
-        for marker in unavailable_markers:
-            if marker in content_lower:
+        for match in _DECISION_RE.finditer(text):
+            if match["unavailable"]:
                 return False, None
+            if price is not None:
+                continue
+            price_str = (match["jpy"] or match["yen"] or match["en"]).replace(",", "")
+            try:
+                candidate = int(price_str)
+            except ValueError:
+                continue  # Only commas
+            if MIN_PRICE <= candidate <= MAX_PRICE:
+                price = candidate
+
+        # Plan cards with prices indicate availability
+        return (True, price) if price is not None else None
+
+    def _parse_room_html(self, content: str) -> bool:
+        """Decide availability from page HTML when the rendered text didn't.
+
+        Sold-out notices are checked first, so a generic booking link
+        elsewhere on the page can't mark a sold-out room as available.
+        """
+        if _UNAVAILABLE_RE.search(content):
+            return False
+        return self._has_booking_button(content)
+
+    def _has_booking_button(self, content: str) -> bool:
+        """Check page HTML for a reservation/details button or link."""
+        return _BUTTON_RE.search(content) is not None
+
 
-        # Check for availability markers
-        available_markers = [
-            "details",
-            "reservations",
-            "予約",
-            "詳細",
-            "book now",
-            "reserve",
-        ]
-
-        # Look for plan cards with prices - indicates availability
-        # 489ban.net shows prices like "29,700 JPY" or "¥29,700"
-        price_patterns = [
-            r"([0-9,]+)\s*JPY",
-            r"[¥￥]([0-9,]+)",
-            r"([0-9,]+)\s*円",
-        ]
-
-        for pattern in price_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                price_str = match.group(1).replace(",", "")
-                try:
-                    parsed_price = int(price_str)
-                    # Reasonable ryokan price range per person
-                    if 15000 <= parsed_price <= 150000:
-                        price = parsed_price
-                        is_available = True
-                        break
-                except ValueError:
-                    pass
-
-        # Also check for reservation/details buttons if no price found
-        if not is_available:
-            for marker in available_markers:
-                if marker in content_lower:
-                    # Check if it's a clickable button/link
-                    button_patterns = [
-                        rf'<button[^>]*>{marker}',
-                        rf'<a[^>]*>{marker}',
-                        rf'class="[^"]*btn[^"]*"[^>]*>{marker}',
-                    ]
-                    for btn_pattern in button_patterns:
-                        if re.search(btn_pattern, content, re.IGNORECASE):
-                            is_available = True
-                            break
-                    if is_available:
-                        break
-
-        return is_available, price
+async def _skip_heavy_resources(route: Route) -> None:
+    """Abort requests for resources the parser doesn't need."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
 
 
 async def check_availability(config: "Config") -> CheckResult:
     """Convenience function to check availability at Miyamaso."""
-    async with BanScraper(config) as scraper:
-        return await scraper.check_availability()
+    try:
+        async with BanScraper(config) as scraper:
+            return await scraper.check_availability()
+    finally:
+        await BanScraper.shutdown()
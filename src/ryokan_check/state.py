@@ -1,86 +1,179 @@
 """State management for tracking notifications."""
 
-import json
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+import asyncio
+import contextlib
+import heapq
+import os
+import time
+from collections.abc import AsyncIterator
+from dataclasses import InitVar, dataclass, field
+from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import orjson
+
 if TYPE_CHECKING:
     from ryokan_check.domain.models import RoomAvailability
 
+# Appended flushes allowed before the state file is rewritten as one snapshot
+COMPACT_EVERY = 100
+
 
 @dataclass
 class NotificationState:
-    """Tracks which room+date combos have been notified to avoid spam."""
+    """Tracks which room+date combos have been notified to avoid spam.
+
+    The state file is an append-only log of {"notified": {...}} JSON lines:
+    a full snapshot followed by one line per flush, later lines winning.
+    It is compacted back to a single snapshot every COMPACT_EVERY appends.
+    Entries map keys to UNIX timestamps of the notification.
+
+    The state file is loaded on construction unless autoload is False.
+    mark_notified only updates memory; flush() persists what changed since
+    the last write, off the event loop.
+    """
 
     state_file: Path
-    notified: dict[str, str] = field(default_factory=dict)
+    notified: dict[str, float] = field(default_factory=dict)
     cooldown_hours: int = 24
+    autoload: InitVar[bool] = True
+    _appends: int = field(default=0, init=False, repr=False)
+    # Entries marked since the last write
+    _pending: dict[str, float] = field(default_factory=dict, init=False, repr=False)
+    # (timestamp, key) min-heap so cleanup only touches expired entries
+    _expiry_heap: list[tuple[float, str]] = field(default_factory=list, init=False, repr=False)
+
+    def __post_init__(self, autoload: bool) -> None:
+        self._rebuild_heap()
+        if autoload:
+            self.load()
 
     def _make_key(self, room: "RoomAvailability") -> str:
-        """Create unique key for property+room+date combo."""
-        return f"{room.property.value}:{room.room.room_id}:{room.check_in}:{room.check_out}"
+        """Create unique key for room+date combo, cached on the room."""
+        return room.notification_key
 
     def load(self) -> None:
         """Load state from file."""
-        if self.state_file.exists():
-            try:
-                data = json.loads(self.state_file.read_text())
-                self.notified = data.get("notified", {})
-                self._cleanup_expired()
-            except (json.JSONDecodeError, KeyError):
-                self.notified = {}
+        if not self.state_file.exists():
+            return
+
+        raw = self.state_file.read_bytes()
+        try:
+            # A single document: a compacted file or a legacy pretty-printed one
+            data = orjson.loads(raw)
+            self.notified = data.get("notified", {})
+            rewrite = len(raw.splitlines()) > 1
+            appends = 0
+        except orjson.JSONDecodeError:
+            self.notified = {}
+            lines = raw.splitlines()
+            parsed = 0
+            for line in lines:
+                try:
+                    self.notified.update(orjson.loads(line)["notified"])
+                except (orjson.JSONDecodeError, KeyError, TypeError):
+                    continue  # Torn or corrupt line
+                parsed += 1
+            # Don't keep appending after torn or corrupt lines
+            rewrite = parsed == 0 or parsed < len(lines)
+            # Lines after the snapshot count toward compaction across restarts
+            appends = max(0, len(lines) - 1)
+        except (KeyError, AttributeError):
+            self.notified = {}
+            return
+
+        # Older files stored ISO datetime strings
+        iso_values = any(isinstance(v, str) for v in self.notified.values())
+        if iso_values:
+            self.notified = {
+                k: datetime.fromisoformat(v).timestamp() if isinstance(v, str) else v
+                for k, v in self.notified.items()
+            }
+        self._rebuild_heap()
+        self._cleanup_expired()
+        if rewrite or iso_values or appends >= COMPACT_EVERY:
+            # Multi-line documents and damaged logs can't be appended to line
+            # by line, and converted timestamps are written back so they're
+            # parsed only once
+            self.save()
+        else:
+            self._appends = appends
 
     def save(self) -> None:
-        """Save state to file."""
+        """Rewrite the state file as a single compact snapshot."""
+        self._write(self._snapshot(), "wb")
+
+    def _snapshot(self) -> bytes:
+        """Serialize live entries as one snapshot line, resetting the append count."""
         self._cleanup_expired()
+        self._appends = 0
+        self._pending = {}
+        return orjson.dumps({"notified": self.notified}) + b"\n"
+
+    def _write(self, data: bytes, mode: str) -> None:
+        """Append data to the state file, or replace it atomically ("wb")."""
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
-        self.state_file.write_text(json.dumps({"notified": self.notified}, indent=2))
+        if mode == "ab":
+            with self.state_file.open("ab") as f:
+                f.write(data)
+            return
+
+        # Write the snapshot beside the file and swap it in, so a crash
+        # mid-compaction leaves the previous log intact
+        tmp_file = self.state_file.with_name(self.state_file.name + ".tmp")
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, self.state_file)
+
+    def _rebuild_heap(self) -> None:
+        """Rebuild the expiry heap from the notified entries."""
+        self._expiry_heap = [(v, k) for k, v in self.notified.items()]
+        heapq.heapify(self._expiry_heap)
 
     def _cleanup_expired(self) -> None:
         """Remove entries older than cooldown period."""
-        cutoff = datetime.now() - timedelta(hours=self.cooldown_hours)
-        self.notified = {
-            k: v
-            for k, v in self.notified.items()
-            if datetime.fromisoformat(v) > cutoff
-        }
+        cutoff = time.time() - self.cooldown_hours * 3600
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= cutoff:
+            timestamp, key = heapq.heappop(heap)
+            # Skip stale heap entries for keys notified again since
+            if self.notified.get(key) == timestamp:
+                del self.notified[key]
 
     def should_notify(self, room: "RoomAvailability") -> bool:
         """Check if we should send a notification for this room."""
-        key = self._make_key(room)
-        if key not in self.notified:
+        last_notified = self.notified.get(self._make_key(room))
+        if last_notified is None:
             return True
 
-        last_notified = datetime.fromisoformat(self.notified[key])
-        return datetime.now() - last_notified > timedelta(hours=self.cooldown_hours)
+        return time.time() - last_notified > self.cooldown_hours * 3600
 
     def mark_notified(self, room: "RoomAvailability") -> None:
-        """Mark a room as notified."""
+        """Mark a room as notified in memory; flush() persists it."""
         key = self._make_key(room)
-        self.notified[key] = datetime.now().isoformat()
-        self.save()
+        timestamp = time.time()
+        self.notified[key] = timestamp
+        heapq.heappush(self._expiry_heap, (timestamp, key))
+        self._pending[key] = timestamp
 
+    async def flush(self) -> None:
+        """Persist entries marked since the last write, off the event loop."""
+        if not self._pending:
+            return
 
-def migrate_old_state_file(state_dir: Path) -> None:
-    """Migrate old single state file to new per-property structure."""
-    old_file = Path.home() / ".miyakowasure-state.json"
-    new_file = state_dir / "miyakowasure-state.json"
+        self._appends += 1
+        if self._appends >= COMPACT_EVERY:
+            data, mode = self._snapshot(), "wb"
+        else:
+            data, mode = orjson.dumps({"notified": self._pending}) + b"\n", "ab"
+            self._pending = {}
+        await asyncio.to_thread(self._write, data, mode)
 
-    if old_file.exists() and not new_file.exists():
-        state_dir.mkdir(parents=True, exist_ok=True)
+    @contextlib.asynccontextmanager
+    async def batch(self) -> AsyncIterator["NotificationState"]:
+        """Group marks into a single write, flushed when the block exits."""
         try:
-            data = json.loads(old_file.read_text())
-            # Old format used room_id:check_in:check_out as key
-            # New format uses property:room_id:check_in:check_out
-            if "notified" in data:
-                migrated = {}
-                for key, value in data["notified"].items():
-                    # Prefix with miyakowasure property
-                    new_key = f"miyakowasure:{key}"
-                    migrated[new_key] = value
-                data["notified"] = migrated
-            new_file.write_text(json.dumps(data, indent=2))
-        except (json.JSONDecodeError, IOError):
-            pass
+            yield self
+        finally:
+            await self.flush()
+
@@ -0,0 +1,6 @@
+"""Shared test setup."""
+
+from ryokan_check.properties import register_all
+
+# Register every property once for the whole session, as the CLI does
+register_all()
@@ -0,0 +1,44 @@
+"""Tests for the command-line interface."""
+
+import pytest
+from typer.testing import CliRunner
+
+from ryokan_check.cli import app
+from ryokan_check.domain.property import Property, get_property_config
+
+
+class CrashingScraper:
+    """Scraper stub whose browser setup always fails."""
+
+    def __init__(self, config) -> None:
+        self.config = config
+
+    async def __aenter__(self) -> "CrashingScraper":
+        raise RuntimeError("browser crashed")
+
+    async def __aexit__(self, *args) -> None:
+        pass
+
+    async def check_availability(self):
+        raise AssertionError("never entered")
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        pass
+
+
+@pytest.fixture
+def crashing_scrapers(monkeypatch) -> None:
+    for prop in Property:
+        monkeypatch.setattr(get_property_config(prop), "scraper_class", CrashingScraper)
+
+
+class TestCheckOnce:
+    def test_exits_nonzero_when_scrapers_raise(self, crashing_scrapers, monkeypatch):
+        for var in ("SMTP_HOST", "SMTP_USER", "SMTP_PASSWORD", "EMAIL_FROM", "EMAIL_TO"):
+            monkeypatch.delenv(var, raising=False)
+
+        result = CliRunner().invoke(app, ["check", "--date", "2026-03-15", "--once"])
+
+        assert result.exit_code == 1
+        assert "browser crashed" in result.output
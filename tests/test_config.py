@@ -4,10 +4,6 @@ from datetime import date
 
 import pytest
 
-# Import property modules to register them
-import ryokan_check.properties.miyakowasure  # noqa: F401
-import ryokan_check.properties.miyamaso  # noqa: F401
-
 from ryokan_check.config import Config
 from ryokan_check.domain.property import Property
 from ryokan_check.properties.miyakowasure.rooms import MiyakowasureRoom
@@ -29,6 +25,38 @@ class TestConfig:
         )
         assert config.check_out_date == date(2026, 3, 16)
 
+    def test_check_in_dates_default_to_check_in_date(self):
+        config = Config(check_in_date=date(2026, 3, 15))
+        assert config.check_in_dates == [date(2026, 3, 15)]
+
+    def test_check_in_dates_lead_with_check_in_date_without_duplicates(self):
+        config = Config(
+            check_in_date=date(2026, 3, 15),
+            check_in_dates=[date(2026, 3, 16), date(2026, 3, 15), date(2026, 3, 16)],
+            nights=2,
+        )
+        assert config.check_in_dates == [date(2026, 3, 15), date(2026, 3, 16)]
+        assert config.check_out_for(date(2026, 3, 16)) == date(2026, 3, 18)
+
+    def test_from_cli_parses_comma_separated_dates(self):
+        config = Config.from_cli("2026-03-15, 2026-03-16", nights=2)
+        assert config.check_in_date == date(2026, 3, 15)
+        assert config.check_in_dates == [date(2026, 3, 15), date(2026, 3, 16)]
+        assert config.check_out_date == date(2026, 3, 17)
+
+    def test_from_cli_rejects_bad_date(self):
+        with pytest.raises(ValueError, match="Invalid date format"):
+            Config.from_cli("2026-15-03")
+
+    def test_is_frozen(self):
+        config = Config(check_in_date=date(2026, 3, 15))
+        with pytest.raises(AttributeError):
+            config.nights = 3
+
+    def test_rejects_zero_concurrent_scrapers(self):
+        with pytest.raises(ValueError, match="max_concurrent_scrapers"):
+            Config(check_in_date=date(2026, 3, 15), max_concurrent_scrapers=0)
+
     def test_rooms_to_check_defaults_to_all(self):
         config = Config(check_in_date=date(2026, 3, 15))
         miyakowasure_rooms = config.rooms_to_check(Property.MIYAKOWASURE)
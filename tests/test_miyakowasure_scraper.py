@@ -0,0 +1,68 @@
+"""Tests for Yadosys results parsing."""
+
+from datetime import date
+
+import pytest
+
+from ryokan_check.config import Config
+from ryokan_check.properties.miyakowasure.rooms import MiyakowasureRoom
+from ryokan_check.properties.miyakowasure.scraper import YadosysScraper
+
+
+@pytest.fixture(scope="module")
+def scraper() -> YadosysScraper:
+    return YadosysScraper(Config(check_in_date=date(2026, 3, 15)))
+
+
+class TestCheckRoomAvailability:
+    @pytest.mark.parametrize(
+        "text,room,available",
+        [
+            ("SAKURA-KAN (river view) unavailable", MiyakowasureRoom.SAKURA_RIVER, False),
+            ("SAKURA-KAN (river view) Available", MiyakowasureRoom.SAKURA_RIVER, True),
+            ("SAKURA-KAN (river view) ×", MiyakowasureRoom.SAKURA_RIVER, False),
+            ("SAKURA-KAN (river view) ○", MiyakowasureRoom.SAKURA_RIVER, True),
+            ("SAKURA-KAN (river view) 満室", MiyakowasureRoom.SAKURA_RIVER, False),
+            (
+                "MOMIJI-KAN VIP ROOM ○ / SAKURA-KAN (river view) ×",
+                MiyakowasureRoom.SAKURA_RIVER,
+                False,
+            ),
+            (
+                "MOMIJI-KAN VIP ROOM × / SAKURA-KAN (river view) ○",
+                MiyakowasureRoom.SAKURA_RIVER,
+                True,
+            ),
+        ],
+        ids=[
+            "unavailable-not-available",
+            "available",
+            "cross",
+            "circle",
+            "japanese-full",
+            "earlier-room-available",
+            "earlier-room-full",
+        ],
+    )
+    def test_marker_after_room_name_decides(self, scraper, text, room, available):
+        result = scraper._check_room_availability(text, room, date(2026, 3, 15))
+        assert result.available is available
+        assert result.price_per_person is None
+
+    def test_price_marks_room_available_without_marker(self, scraper):
+        result = scraper._check_room_availability(
+            "SAKURA-KAN (river view) ¥25,000 2 rooms left",
+            MiyakowasureRoom.SAKURA_RIVER,
+            date(2026, 3, 15),
+        )
+        assert result.available is True
+        assert result.price_per_person == 25000
+        assert result.spots_left == 2
+
+    def test_out_of_range_price_does_not_mark_available(self, scraper):
+        result = scraper._check_room_availability(
+            "SAKURA-KAN (river view) × ¥5,000",
+            MiyakowasureRoom.SAKURA_RIVER,
+            date(2026, 3, 15),
+        )
+        assert result.available is False
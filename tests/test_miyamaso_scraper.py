@@ -0,0 +1,57 @@
+"""Tests for 489ban.net page parsing."""
+
+from datetime import date
+
+import pytest
+
+from ryokan_check.config import Config
+from ryokan_check.properties.miyamaso.scraper import BanScraper
+
+
+@pytest.fixture(scope="module")
+def scraper() -> BanScraper:
+    return BanScraper(Config(check_in_date=date(2026, 3, 15)))
+
+
+class TestParseRoomText:
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("Plan A 29,700 JPY / Plan B Sold Out", (False, None)),
+            ("¥29,700 per person\n満室", (False, None)),
+            ("入湯税150円\nStandard plan 29,700円", (True, 29700)),
+            ("Bath tax ¥150, plan ¥31,000", (True, 31000)),
+            ("29,700 JPY", (True, 29700)),
+            (", JPY then 30,000円", (True, 30000)),
+            ("Check-in 15:00, check-out 10:00", None),
+            ("入湯税150円 only", None),
+        ],
+        ids=[
+            "sold-out-after-price",
+            "japanese-sold-out-after-price",
+            "small-fee-skipped",
+            "small-yen-fee-skipped",
+            "jpy-price",
+            "only-commas-skipped",
+            "neither",
+            "only-small-fee",
+        ],
+    )
+    def test_parse_room_text(self, scraper, text, expected):
+        assert scraper._parse_room_text(text) == expected
+
+
+class TestParseRoomHtml:
+    @pytest.mark.parametrize(
+        "html,expected",
+        [
+            ('<a href="/reserve">予約</a><div class="status">満室</div>', False),
+            ('<a href="/reserve">予約</a><p>This plan is sold out</p>', False),
+            ('<button type="button">Book Now</button>', True),
+            ('<span class="btn-primary">詳細</span>', True),
+            ("<p>Details about the room</p>", False),
+        ],
+        ids=["sold-out-with-link", "sold-out-english", "button", "btn-class", "no-button"],
+    )
+    def test_parse_room_html(self, scraper, html, expected):
+        assert scraper._parse_room_html(html) is expected
@@ -4,30 +4,41 @@ from datetime import date
 
 import pytest
 
-# Import property modules to register them
-import ryokan_check.properties.miyakowasure  # noqa: F401
-import ryokan_check.properties.miyamaso  # noqa: F401
-
 from ryokan_check.domain.models import RoomAvailability
 from ryokan_check.domain.property import Property
 from ryokan_check.properties.miyakowasure.rooms import MiyakowasureRoom
 from ryokan_check.properties.miyamaso.rooms import MiyamasoRoom
 
 
+MIYAKOWASURE_VALID_CASES = [
+    ("sakura", MiyakowasureRoom.SAKURA_RIVER),
+    ("SAKURA", MiyakowasureRoom.SAKURA_RIVER),
+    ("sakura-river", MiyakowasureRoom.SAKURA_RIVER),
+    ("momiji-vip", MiyakowasureRoom.MOMIJI_VIP),
+    ("vip", MiyakowasureRoom.MOMIJI_VIP),
+    ("twin", MiyakowasureRoom.MOMIJI_TWIN),
+    ("tsubaki-view", MiyakowasureRoom.TSUBAKI_VIEW),
+]
+MIYAKOWASURE_INVALID_CASES = ["invalid", "", "random-room"]
+
+MIYAMASO_VALID_CASES = [
+    ("hinakura", MiyamasoRoom.HINAKURA),
+    ("HINAKURA", MiyamasoRoom.HINAKURA),
+    ("rian", MiyamasoRoom.RIAN_SANSUI_MAISONETTE),
+    ("rian-maisonette", MiyamasoRoom.RIAN_SANSUI_MAISONETTE),
+    ("rian-japanese", MiyamasoRoom.RIAN_SANSUI_JAPANESE),
+]
+MIYAMASO_INVALID_CASES = ["invalid", "", "sakura"]  # sakura is not a Miyamaso room
+
+
 class TestMiyakowasureRoom:
-    def test_from_string_valid_inputs(self):
-        assert MiyakowasureRoom.from_string("sakura") == MiyakowasureRoom.SAKURA_RIVER
-        assert MiyakowasureRoom.from_string("SAKURA") == MiyakowasureRoom.SAKURA_RIVER
-        assert MiyakowasureRoom.from_string("sakura-river") == MiyakowasureRoom.SAKURA_RIVER
-        assert MiyakowasureRoom.from_string("momiji-vip") == MiyakowasureRoom.MOMIJI_VIP
-        assert MiyakowasureRoom.from_string("vip") == MiyakowasureRoom.MOMIJI_VIP
-        assert MiyakowasureRoom.from_string("twin") == MiyakowasureRoom.MOMIJI_TWIN
-        assert MiyakowasureRoom.from_string("tsubaki-view") == MiyakowasureRoom.TSUBAKI_VIEW
-
-    def test_from_string_invalid_inputs(self):
-        assert MiyakowasureRoom.from_string("invalid") is None
-        assert MiyakowasureRoom.from_string("") is None
-        assert MiyakowasureRoom.from_string("random-room") is None
+    @pytest.mark.parametrize("raw,expected", MIYAKOWASURE_VALID_CASES)
+    def test_from_string_valid(self, raw, expected):
+        assert MiyakowasureRoom.from_string(raw) == expected
+
+    @pytest.mark.parametrize("raw", MIYAKOWASURE_INVALID_CASES)
+    def test_from_string_invalid(self, raw):
+        assert MiyakowasureRoom.from_string(raw) is None
 
     def test_display_name(self):
         assert "SAKURA" in MiyakowasureRoom.SAKURA_RIVER.display_name
@@ -45,17 +56,13 @@ class TestMiyakowasureRoom:
 
 
 class TestMiyamasoRoom:
-    def test_from_string_valid_inputs(self):
-        assert MiyamasoRoom.from_string("hinakura") == MiyamasoRoom.HINAKURA
-        assert MiyamasoRoom.from_string("HINAKURA") == MiyamasoRoom.HINAKURA
-        assert MiyamasoRoom.from_string("rian") == MiyamasoRoom.RIAN_SANSUI_MAISONETTE
-        assert MiyamasoRoom.from_string("rian-maisonette") == MiyamasoRoom.RIAN_SANSUI_MAISONETTE
-        assert MiyamasoRoom.from_string("rian-japanese") == MiyamasoRoom.RIAN_SANSUI_JAPANESE
-
-    def test_from_string_invalid_inputs(self):
-        assert MiyamasoRoom.from_string("invalid") is None
-        assert MiyamasoRoom.from_string("") is None
-        assert MiyamasoRoom.from_string("sakura") is None  # Not a Miyamaso room
+    @pytest.mark.parametrize("raw,expected", MIYAMASO_VALID_CASES)
+    def test_from_string_valid(self, raw, expected):
+        assert MiyamasoRoom.from_string(raw) == expected
+
+    @pytest.mark.parametrize("raw", MIYAMASO_INVALID_CASES)
+    def test_from_string_invalid(self, raw):
+        assert MiyamasoRoom.from_string(raw) is None
 
     def test_parse_multiple_rian(self):
         rooms = MiyamasoRoom.parse_multiple("rian")
@@ -137,3 +144,34 @@ class TestRoomAvailability:
         )
         message = room.notification_message()
         assert "TBD" in message
+
+    def test_is_frozen_and_caches_booking_url(self):
+        room = RoomAvailability(
+            property=Property.MIYAKOWASURE,
+            room=MiyakowasureRoom.SAKURA_RIVER,
+            check_in=date(2026, 3, 15),
+            check_out=date(2026, 3, 16),
+            available=True,
+        )
+        assert room.booking_url is room.booking_url
+        with pytest.raises(AttributeError):
+            room.available = False
+
+    def test_caches_notification_key(self):
+        room = RoomAvailability(
+            property=Property.MIYAKOWASURE,
+            room=MiyakowasureRoom.SAKURA_RIVER,
+            check_in=date(2026, 3, 15),
+            check_out=date(2026, 3, 16),
+            available=True,
+            price_per_person=25000,
+        )
+        assert room.notification_key is room.notification_key
+        assert room.notification_key != RoomAvailability(
+            property=Property.MIYAKOWASURE,
+            room=MiyakowasureRoom.SAKURA_RIVER,
+            check_in=date(2026, 3, 15),
+            check_out=date(2026, 3, 16),
+            available=True,
+            price_per_person=27000,
+        ).notification_key
@@ -0,0 +1,123 @@
+"""Tests for email notifications."""
+
+from dataclasses import replace
+from datetime import date
+from types import SimpleNamespace
+
+import aiosmtplib
+import pytest
+
+import ryokan_check.notifier as notifier_module
+from ryokan_check.domain.models import RoomAvailability
+from ryokan_check.domain.property import Property, get_property_config
+from ryokan_check.notifier import (
+    DEDUP_TTL_SECONDS,
+    SMTP_KEEPALIVE_EXPIRY,
+    EmailConfig,
+    EmailNotifier,
+)
+from ryokan_check.properties.miyakowasure.rooms import MiyakowasureRoom
+
+
+class FakeSMTP:
+    """Stands in for aiosmtplib.SMTP, recording connections and messages."""
+
+    def __init__(self, **kwargs) -> None:
+        self.is_connected = False
+        self.connects = 0
+        self.closes = 0
+        self.fail = False
+        self.sent: list = []
+
+    async def connect(self) -> None:
+        self.is_connected = True
+        self.connects += 1
+
+    def close(self) -> None:
+        self.is_connected = False
+        self.closes += 1
+
+    async def quit(self) -> None:
+        self.is_connected = False
+
+    async def send_message(self, msg) -> None:
+        if self.fail:
+            raise aiosmtplib.SMTPResponseException(550, "rejected")
+        self.sent.append(msg)
+
+
+@pytest.fixture
+def clock(monkeypatch) -> SimpleNamespace:
+    # Only the notifier's clock is faked; the event loop keeps the real one
+    fake = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(notifier_module, "time", SimpleNamespace(monotonic=lambda: fake.now))
+    return fake
+
+
+@pytest.fixture
+def email_config() -> EmailConfig:
+    return EmailConfig(
+        smtp_host="smtp.example.com",
+        smtp_port=587,
+        smtp_user="user",
+        smtp_password="secret",
+        from_address="from@example.com",
+        to_address="to@example.com",
+    )
+
+
+@pytest.fixture
+async def notifier(monkeypatch, clock, email_config):
+    monkeypatch.setattr(aiosmtplib, "SMTP", FakeSMTP)
+    async with EmailNotifier(email_config) as notifier:
+        yield notifier
+
+
+@pytest.fixture(scope="module")
+def sample_room() -> RoomAvailability:
+    return RoomAvailability(
+        property=Property.MIYAKOWASURE,
+        room=MiyakowasureRoom.SAKURA_RIVER,
+        check_in=date(2026, 3, 15),
+        check_out=date(2026, 3, 16),
+        available=True,
+        price_per_person=25000,
+    )
+
+
+@pytest.fixture(scope="module")
+def prop_config():
+    return get_property_config(Property.MIYAKOWASURE)
+
+
+class TestEmailNotifier:
+    async def test_duplicate_send_is_suppressed(self, notifier, sample_room, prop_config):
+        assert await notifier.send(sample_room, prop_config) is True
+        assert await notifier.send(sample_room, prop_config) is True
+        assert len(notifier._smtp.sent) == 1
+
+    async def test_duplicate_sent_again_after_ttl(self, notifier, clock, sample_room, prop_config):
+        await notifier.send(sample_room, prop_config)
+        clock.now += DEDUP_TTL_SECONDS + 1
+
+        assert await notifier.send(sample_room, prop_config) is True
+        assert len(notifier._smtp.sent) == 2
+
+    async def test_failed_send_is_not_recorded(self, notifier, sample_room, prop_config):
+        notifier._smtp.fail = True
+        assert await notifier.send(sample_room, prop_config) is False
+
+        notifier._smtp.fail = False
+        assert await notifier.send(sample_room, prop_config) is True
+        assert len(notifier._smtp.sent) == 1
+
+    async def test_reconnects_after_keepalive_expiry(self, notifier, clock, sample_room, prop_config):
+        await notifier.send(sample_room, prop_config)
+        clock.now += SMTP_KEEPALIVE_EXPIRY / 2
+        await notifier.send(replace(sample_room, price_per_person=26000), prop_config)
+        assert (notifier._smtp.connects, notifier._smtp.closes) == (1, 0)
+
+        clock.now += SMTP_KEEPALIVE_EXPIRY + 1
+        await notifier.send(replace(sample_room, price_per_person=27000), prop_config)
+        assert (notifier._smtp.connects, notifier._smtp.closes) == (2, 1)
+        assert len(notifier._smtp.sent) == 3
@@ -2,10 +2,6 @@
 
 import pytest
 
-# Import property modules to register them
-import ryokan_check.properties.miyakowasure  # noqa: F401
-import ryokan_check.properties.miyamaso  # noqa: F401
-
 from ryokan_check.domain.property import (
     Property,
     PropertyConfig,
@@ -14,21 +10,32 @@ from ryokan_check.domain.property import (
 )
 
 
-class TestProperty:
-    def test_from_string_miyakowasure(self):
-        assert Property.from_string("miyakowasure") == Property.MIYAKOWASURE
-        assert Property.from_string("MIYAKOWASURE") == Property.MIYAKOWASURE
-        assert Property.from_string("  miyakowasure  ") == Property.MIYAKOWASURE
+PROPERTY_VALID_CASES = [
+    ("miyakowasure", Property.MIYAKOWASURE),
+    ("MIYAKOWASURE", Property.MIYAKOWASURE),
+    ("  miyakowasure  ", Property.MIYAKOWASURE),
+    ("miyamaso", Property.MIYAMASO),
+    ("takamiya", Property.MIYAMASO),
+    ("TAKAMIYA", Property.MIYAMASO),
+]
+PROPERTY_INVALID_CASES = ["invalid", "", "random"]
 
-    def test_from_string_miyamaso_aliases(self):
-        assert Property.from_string("miyamaso") == Property.MIYAMASO
-        assert Property.from_string("takamiya") == Property.MIYAMASO
-        assert Property.from_string("TAKAMIYA") == Property.MIYAMASO
+# Only the Miyamaso rooms we monitor have a private onsen; one case per room
+PRIVATE_ONSEN_CASES = [
+    pytest.param(room, expected, id=f"{prop.value}-{room.name}")
+    for prop, expected in [(Property.MIYAKOWASURE, False), (Property.MIYAMASO, True)]
+    for room in get_property_config(prop).get_rooms()
+]
 
-    def test_from_string_invalid(self):
-        assert Property.from_string("invalid") is None
-        assert Property.from_string("") is None
-        assert Property.from_string("random") is None
+
+class TestProperty:
+    @pytest.mark.parametrize("raw,expected", PROPERTY_VALID_CASES)
+    def test_from_string_valid(self, raw, expected):
+        assert Property.from_string(raw) == expected
+
+    @pytest.mark.parametrize("raw", PROPERTY_INVALID_CASES)
+    def test_from_string_invalid(self, raw):
+        assert Property.from_string(raw) is None
 
     def test_display_name(self):
         assert "Miyakowasure" in Property.MIYAKOWASURE.display_name
@@ -36,64 +43,71 @@ class TestProperty:
         assert "Zao" in Property.MIYAMASO.display_name
 
 
+@pytest.fixture(scope="module")
+def miyakowasure_config() -> PropertyConfig:
+    return get_property_config(Property.MIYAKOWASURE)
+
+
+@pytest.fixture(scope="module")
+def miyamaso_config() -> PropertyConfig:
+    return get_property_config(Property.MIYAMASO)
+
+
+@pytest.mark.xdist_group(name="property_registry")
 class TestPropertyConfig:
-    def test_miyakowasure_config_registered(self):
-        config = get_property_config(Property.MIYAKOWASURE)
-        assert config.display_name == "Natsuse Onsen Miyakowasure"
-        assert "yadosys.com" in config.base_url
-
-    def test_miyamaso_config_registered(self):
-        config = get_property_config(Property.MIYAMASO)
-        assert "Miyamaso" in config.display_name
-        assert "489ban.net" in config.base_url
-
-    def test_get_rooms_miyakowasure(self):
-        config = get_property_config(Property.MIYAKOWASURE)
-        rooms = config.get_rooms()
+    def test_miyakowasure_config_registered(self, miyakowasure_config):
+        assert miyakowasure_config.display_name == "Natsuse Onsen Miyakowasure"
+        assert "yadosys.com" in miyakowasure_config.base_url
+
+    def test_miyamaso_config_registered(self, miyamaso_config):
+        assert "Miyamaso" in miyamaso_config.display_name
+        assert "489ban.net" in miyamaso_config.base_url
+
+    def test_get_rooms_miyakowasure(self, miyakowasure_config):
+        rooms = miyakowasure_config.get_rooms()
         assert len(rooms) == 6  # 6 Miyakowasure rooms
 
-    def test_get_rooms_miyamaso(self):
-        config = get_property_config(Property.MIYAMASO)
-        rooms = config.get_rooms()
+    def test_get_rooms_miyamaso(self, miyamaso_config):
+        rooms = miyamaso_config.get_rooms()
         assert len(rooms) == 3  # 3 Miyamaso rooms (Hinakura + 2 Rian Sansui)
 
-    def test_parse_room_miyakowasure(self):
-        config = get_property_config(Property.MIYAKOWASURE)
-        room = config.parse_room("sakura")
+    def test_get_rooms_is_built_once(self, miyakowasure_config):
+        assert miyakowasure_config.get_rooms() is miyakowasure_config.get_rooms()
+
+    def test_parse_room_miyakowasure(self, miyakowasure_config):
+        room = miyakowasure_config.parse_room("sakura")
         assert room is not None
         assert "SAKURA" in room.display_name
 
-    def test_parse_room_miyamaso(self):
-        config = get_property_config(Property.MIYAMASO)
-        room = config.parse_room("hinakura")
+    def test_parse_room_miyamaso(self, miyamaso_config):
+        room = miyamaso_config.parse_room("hinakura")
         assert room is not None
         assert "HINAKURA" in room.display_name
 
-    def test_parse_room_cross_property_fails(self):
+    def test_parse_room_cross_property_fails(self, miyakowasure_config, miyamaso_config):
         # Miyakowasure rooms shouldn't parse in Miyamaso
-        miyamaso_config = get_property_config(Property.MIYAMASO)
         assert miyamaso_config.parse_room("sakura") is None
 
         # Miyamaso rooms shouldn't parse in Miyakowasure
-        miyakowasure_config = get_property_config(Property.MIYAKOWASURE)
         assert miyakowasure_config.parse_room("hinakura") is None
 
-    def test_miyamaso_rooms_have_private_onsen(self):
-        config = get_property_config(Property.MIYAMASO)
-        for room in config.get_rooms():
-            assert room.has_private_onsen is True
+    def test_parse_rooms_expands_room_groups(self, miyamaso_config):
+        assert len(miyamaso_config.parse_rooms("rian")) == 2
+        assert len(miyamaso_config.parse_rooms("hinakura")) == 1
+        assert miyamaso_config.parse_rooms("sakura") == []
+
+    def test_parse_rooms_without_group_hook(self, miyakowasure_config):
+        assert len(miyakowasure_config.parse_rooms("sakura")) == 1
+        assert miyakowasure_config.parse_rooms("rian") == []
 
-    def test_miyakowasure_rooms_no_private_onsen(self):
-        config = get_property_config(Property.MIYAKOWASURE)
-        for room in config.get_rooms():
-            assert room.has_private_onsen is False
+    @pytest.mark.parametrize("room,expected", PRIVATE_ONSEN_CASES)
+    def test_room_private_onsen(self, room, expected):
+        assert room.has_private_onsen is expected
 
     def test_all_properties_registered(self):
         properties = get_all_properties()
         assert Property.MIYAKOWASURE in properties
         assert Property.MIYAMASO in properties
 
-    def test_state_filenames_unique(self):
-        miyakowasure = get_property_config(Property.MIYAKOWASURE)
-        miyamaso = get_property_config(Property.MIYAMASO)
-        assert miyakowasure.state_filename != miyamaso.state_filename
+    def test_state_filenames_unique(self, miyakowasure_config, miyamaso_config):
+        assert miyakowasure_config.state_filename != miyamaso_config.state_filename
@@ -1,20 +1,21 @@
 """Tests for notification state management."""
 
 import json
+import time
+from dataclasses import replace
 from datetime import date, datetime, timedelta
 from pathlib import Path
 
 import pytest
 
-# Import property modules to register them
-import ryokan_check.properties.miyakowasure  # noqa: F401
-import ryokan_check.properties.miyamaso  # noqa: F401
-
 from ryokan_check.domain.models import RoomAvailability
 from ryokan_check.domain.property import Property
 from ryokan_check.properties.miyakowasure.rooms import MiyakowasureRoom
 from ryokan_check.properties.miyamaso.rooms import MiyamasoRoom
-from ryokan_check.state import NotificationState, migrate_old_state_file
+from ryokan_check.state import COMPACT_EVERY, NotificationState
+
+# Fixed clock for cooldown boundaries
+FROZEN_NOW = datetime(2026, 1, 2, 2, 0, 0)
 
 
 @pytest.fixture
@@ -22,7 +23,18 @@ def temp_state_file(tmp_path) -> Path:
     return tmp_path / "test-state.json"
 
 
+@pytest.fixture(scope="session")
+def shared_state_dir(tmp_path_factory) -> Path:
+    return tmp_path_factory.mktemp("state")
+
+
 @pytest.fixture
+def readonly_state_file(shared_state_dir, request) -> Path:
+    """Per-test path in a shared directory, for tests that never write the file."""
+    return shared_state_dir / f"{request.node.name}.json"
+
+
+@pytest.fixture(scope="module")
 def sample_miyakowasure_room() -> RoomAvailability:
     return RoomAvailability(
         property=Property.MIYAKOWASURE,
@@ -33,7 +45,7 @@ def sample_miyakowasure_room() -> RoomAvailability:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_miyamaso_room() -> RoomAvailability:
     return RoomAvailability(
         property=Property.MIYAMASO,
@@ -44,143 +56,200 @@ def sample_miyamaso_room() -> RoomAvailability:
     )
 
 
+@pytest.mark.xdist_group(name="property_registry")
 class TestNotificationState:
-    def test_should_notify_when_never_notified(self, temp_state_file, sample_miyakowasure_room):
-        state = NotificationState(state_file=temp_state_file)
+    def test_should_notify_when_never_notified(self, readonly_state_file, sample_miyakowasure_room):
+        state = NotificationState(state_file=readonly_state_file)
         assert state.should_notify(sample_miyakowasure_room) is True
 
-    def test_should_not_notify_when_recently_notified(self, temp_state_file, sample_miyakowasure_room):
-        state = NotificationState(state_file=temp_state_file)
+    def test_should_not_notify_when_recently_notified(self, readonly_state_file, sample_miyakowasure_room):
+        state = NotificationState(state_file=readonly_state_file)
         state.mark_notified(sample_miyakowasure_room)
         assert state.should_notify(sample_miyakowasure_room) is False
 
-    def test_should_notify_after_cooldown_expires(self, temp_state_file, sample_miyakowasure_room):
-        state = NotificationState(state_file=temp_state_file, cooldown_hours=24)
+    @pytest.mark.parametrize("hours_ago,expected", [(23, False), (25, True), (24 * 7, True)])
+    def test_should_notify_after_cooldown_expires(
+        self, readonly_state_file, sample_miyakowasure_room, monkeypatch, hours_ago, expected
+    ):
+        monkeypatch.setattr(time, "time", lambda: FROZEN_NOW.timestamp())
+        state = NotificationState(state_file=readonly_state_file, cooldown_hours=24)
 
-        old_time = datetime.now() - timedelta(hours=25)
+        old_time = FROZEN_NOW - timedelta(hours=hours_ago)
         key = state._make_key(sample_miyakowasure_room)
-        state.notified[key] = old_time.isoformat()
+        state.notified[key] = old_time.timestamp()
 
-        assert state.should_notify(sample_miyakowasure_room) is True
+        assert state.should_notify(sample_miyakowasure_room) is expected
+
+    def test_cleanup_keeps_entries_notified_again(self, readonly_state_file, sample_miyakowasure_room):
+        state = NotificationState(state_file=readonly_state_file, cooldown_hours=24)
+        key = state._make_key(sample_miyakowasure_room)
+        state = NotificationState(
+            state_file=readonly_state_file,
+            notified={key: (datetime.now() - timedelta(hours=25)).timestamp(), "stale": 0.0},
+        )
+        state.mark_notified(sample_miyakowasure_room)
+
+        state._cleanup_expired()
+        assert list(state.notified) == [key]
 
-    def test_state_persists_to_file(self, temp_state_file, sample_miyakowasure_room):
+    async def test_state_persists_to_file(self, temp_state_file, sample_miyakowasure_room):
         state1 = NotificationState(state_file=temp_state_file)
         state1.mark_notified(sample_miyakowasure_room)
+        await state1.flush()
 
         state2 = NotificationState(state_file=temp_state_file)
-        state2.load()
         assert state2.should_notify(sample_miyakowasure_room) is False
 
-    def test_load_handles_missing_file(self, temp_state_file):
-        state = NotificationState(state_file=temp_state_file)
-        state.load()
+    def test_load_handles_missing_file(self, readonly_state_file):
+        state = NotificationState(state_file=readonly_state_file)
         assert state.notified == {}
 
+    def test_autoload_disabled_skips_file(self, temp_state_file, sample_miyakowasure_room):
+        state = NotificationState(state_file=temp_state_file)
+        state.mark_notified(sample_miyakowasure_room)
+        state.save()
+
+        assert NotificationState(state_file=temp_state_file, autoload=False).notified == {}
+
     def test_load_handles_corrupt_file(self, temp_state_file):
         temp_state_file.write_text("not valid json")
         state = NotificationState(state_file=temp_state_file)
-        state.load()
         assert state.notified == {}
+        # The garbage is replaced so later appends start from a clean snapshot
+        assert json.loads(temp_state_file.read_text()) == {"notified": {}}
 
-    def test_different_rooms_tracked_separately(self, temp_state_file):
-        room1 = RoomAvailability(
-            property=Property.MIYAKOWASURE,
-            room=MiyakowasureRoom.SAKURA_RIVER,
-            check_in=date(2026, 3, 15),
-            check_out=date(2026, 3, 16),
-            available=True,
-        )
-        room2 = RoomAvailability(
-            property=Property.MIYAKOWASURE,
-            room=MiyakowasureRoom.MOMIJI_VIP,
-            check_in=date(2026, 3, 15),
-            check_out=date(2026, 3, 16),
-            available=True,
-        )
-
+    @pytest.mark.parametrize("content", ["", "  \n"], ids=["empty", "whitespace"])
+    def test_load_handles_empty_file(self, temp_state_file, content):
+        temp_state_file.write_text(content)
         state = NotificationState(state_file=temp_state_file)
-        state.mark_notified(room1)
-
-        assert state.should_notify(room1) is False
-        assert state.should_notify(room2) is True
-
-    def test_different_dates_tracked_separately(self, temp_state_file):
-        room1 = RoomAvailability(
-            property=Property.MIYAKOWASURE,
-            room=MiyakowasureRoom.SAKURA_RIVER,
-            check_in=date(2026, 3, 15),
-            check_out=date(2026, 3, 16),
-            available=True,
-        )
-        room2 = RoomAvailability(
-            property=Property.MIYAKOWASURE,
-            room=MiyakowasureRoom.SAKURA_RIVER,
-            check_in=date(2026, 3, 20),
-            check_out=date(2026, 3, 21),
-            available=True,
-        )
+        assert state.notified == {}
+        assert state._appends == 0
 
+    async def test_torn_line_is_dropped_on_load(self, temp_state_file, sample_miyakowasure_room):
         state = NotificationState(state_file=temp_state_file)
-        state.mark_notified(room1)
+        state.mark_notified(sample_miyakowasure_room)
+        await state.flush()
+        with temp_state_file.open("a") as f:
+            f.write('{"notified": {"torn')
+
+        reloaded = NotificationState(state_file=temp_state_file)
+        assert reloaded.should_notify(sample_miyakowasure_room) is False
+        assert len(temp_state_file.read_text().splitlines()) == 1
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"room": MiyakowasureRoom.MOMIJI_VIP},
+            {"check_in": date(2026, 3, 20), "check_out": date(2026, 3, 21)},
+            {"property": Property.MIYAMASO, "room": MiyamasoRoom.HINAKURA},
+        ],
+        ids=["room", "date", "property"],
+    )
+    def test_tracked_separately(self, readonly_state_file, sample_miyakowasure_room, overrides):
+        other = replace(sample_miyakowasure_room, **overrides)
 
-        assert state.should_notify(room1) is False
-        assert state.should_notify(room2) is True
+        state = NotificationState(state_file=readonly_state_file)
+        state.mark_notified(sample_miyakowasure_room)
 
-    def test_different_properties_tracked_separately(
+        assert state.should_notify(sample_miyakowasure_room) is False
+        assert state.should_notify(other) is True
+
+    def test_key_differs_per_property(self, readonly_state_file, sample_miyakowasure_room, sample_miyamaso_room):
+        state = NotificationState(state_file=readonly_state_file)
+        key1 = state._make_key(sample_miyakowasure_room)
+        key2 = state._make_key(sample_miyamaso_room)
+
+        assert key1 != key2
+
+    def test_price_change_notifies_again(self, readonly_state_file, sample_miyakowasure_room):
+        state = NotificationState(state_file=readonly_state_file)
+        state.mark_notified(sample_miyakowasure_room)
+
+        repriced = replace(sample_miyakowasure_room, price_per_person=30000)
+        assert state.should_notify(repriced) is True
+
+    async def test_appended_entries_survive_reload(self, temp_state_file, sample_miyakowasure_room, sample_miyamaso_room):
+        state1 = NotificationState(state_file=temp_state_file)
+        state1.mark_notified(sample_miyakowasure_room)
+        await state1.flush()
+        state1.mark_notified(sample_miyamaso_room)
+        await state1.flush()
+        assert len(temp_state_file.read_text().splitlines()) == 2
+
+        state2 = NotificationState(state_file=temp_state_file)
+        assert state2.should_notify(sample_miyakowasure_room) is False
+        assert state2.should_notify(sample_miyamaso_room) is False
+
+    async def test_marks_are_written_on_flush_as_one_line(
         self, temp_state_file, sample_miyakowasure_room, sample_miyamaso_room
     ):
         state = NotificationState(state_file=temp_state_file)
         state.mark_notified(sample_miyakowasure_room)
+        state.mark_notified(sample_miyamaso_room)
+        assert not temp_state_file.exists()
 
-        assert state.should_notify(sample_miyakowasure_room) is False
-        assert state.should_notify(sample_miyamaso_room) is True
+        await state.flush()
+        assert len(temp_state_file.read_text().splitlines()) == 1
+
+        reloaded = NotificationState(state_file=temp_state_file)
+        assert reloaded.should_notify(sample_miyakowasure_room) is False
+        assert reloaded.should_notify(sample_miyamaso_room) is False
 
-    def test_key_includes_property(self, temp_state_file, sample_miyakowasure_room, sample_miyamaso_room):
+    async def test_batch_flushes_once_on_exit(
+        self, temp_state_file, sample_miyakowasure_room, sample_miyamaso_room
+    ):
         state = NotificationState(state_file=temp_state_file)
-        key1 = state._make_key(sample_miyakowasure_room)
-        key2 = state._make_key(sample_miyamaso_room)
+        async with state.batch():
+            state.mark_notified(sample_miyakowasure_room)
+            state.mark_notified(sample_miyamaso_room)
+            assert not temp_state_file.exists()
 
-        assert "miyakowasure" in key1
-        assert "miyamaso" in key2
-        assert key1 != key2
+        assert len(temp_state_file.read_text().splitlines()) == 1
+        reloaded = NotificationState(state_file=temp_state_file)
+        assert reloaded.should_notify(sample_miyamaso_room) is False
+
+    async def test_compacts_after_many_appends(self, temp_state_file, sample_miyakowasure_room):
+        state = NotificationState(state_file=temp_state_file)
+        for price in range(COMPACT_EVERY):
+            state.mark_notified(replace(sample_miyakowasure_room, price_per_person=price))
+            await state.flush()
+        assert len(temp_state_file.read_text().splitlines()) == 1
+        assert list(temp_state_file.parent.iterdir()) == [temp_state_file]
+
+    async def test_compaction_counts_appends_across_restarts(
+        self, temp_state_file, sample_miyakowasure_room
+    ):
+        flushes_per_run = COMPACT_EVERY * 3 // 5
+        price = 0
+        for _ in range(5):
+            state = NotificationState(state_file=temp_state_file)
+            for _ in range(flushes_per_run):
+                price += 1
+                state.mark_notified(replace(sample_miyakowasure_room, price_per_person=price))
+                await state.flush()
+
+        assert len(temp_state_file.read_text().splitlines()) <= COMPACT_EVERY
+        reloaded = NotificationState(state_file=temp_state_file)
+        assert len(reloaded.notified) == price
+
+    async def test_loads_legacy_pretty_printed_file(self, temp_state_file, sample_miyakowasure_room):
+        key = sample_miyakowasure_room.notification_key
+        temp_state_file.write_text(json.dumps({"notified": {key: datetime.now().isoformat()}}, indent=2))
+
+        state = NotificationState(state_file=temp_state_file)
+        state.mark_notified(replace(sample_miyakowasure_room, price_per_person=25000))
+        await state.flush()
+
+        reloaded = NotificationState(state_file=temp_state_file)
+        assert reloaded.should_notify(sample_miyakowasure_room) is False
+        assert all(isinstance(ts, float) for ts in reloaded.notified.values())
+
+    def test_iso_timestamps_are_rewritten_on_load(self, temp_state_file, sample_miyakowasure_room):
+        key = sample_miyakowasure_room.notification_key
+        temp_state_file.write_text(json.dumps({"notified": {key: datetime.now().isoformat()}}))
+
+        NotificationState(state_file=temp_state_file)
 
+        stored = json.loads(temp_state_file.read_text())["notified"][key]
+        assert isinstance(stored, float)
 
-class TestStateMigration:
-    def test_migrate_old_state_file(self, tmp_path):
-        # Create old-style state file
-        old_file = tmp_path / ".miyakowasure-state.json"
-        old_data = {
-            "notified": {
-                "00001:2026-03-15:2026-03-16": "2026-02-01T14:30:00.123456"
-            }
-        }
-        old_file.write_text(json.dumps(old_data))
-
-        # Create new state directory
-        new_dir = tmp_path / ".ryokan-check"
-
-        # Patch home directory for test
-        import ryokan_check.state as state_module
-        original_home = Path.home
-        try:
-            # This is a simplified test - in real usage, home() would be patched
-            new_dir.mkdir(parents=True, exist_ok=True)
-            new_file = new_dir / "miyakowasure-state.json"
-
-            # Simulate migration
-            if old_file.exists() and not new_file.exists():
-                data = json.loads(old_file.read_text())
-                if "notified" in data:
-                    migrated = {}
-                    for key, value in data["notified"].items():
-                        new_key = f"miyakowasure:{key}"
-                        migrated[new_key] = value
-                    data["notified"] = migrated
-                new_file.write_text(json.dumps(data, indent=2))
-
-            # Verify migration
-            assert new_file.exists()
-            migrated_data = json.loads(new_file.read_text())
-            assert "miyakowasure:00001:2026-03-15:2026-03-16" in migrated_data["notified"]
-        finally:
-            pass